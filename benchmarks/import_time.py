@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+CODE = """
+from time import perf_counter
+start = perf_counter()
+import {}
+print(perf_counter() - start)
+"""
+
+
+def measure(modules: str) -> float:
+    result = subprocess.run([sys.executable, "-c", CODE.format(modules)], stdout=subprocess.PIPE, check=True)
+    return float(result.stdout)
+
+
+# each import is done in a new interpreter, so nothing is cached in sys.modules
+print("dataclasses, typing", min(measure("dataclasses, typing") for _ in range(20)))  # 0.032940089000021544
+print("dataclass_factory  ", min(measure("dataclass_factory") for _ in range(20)))  # 0.11130732699984947
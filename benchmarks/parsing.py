@@ -56,6 +56,17 @@ factory_debug = Factory(schemas={
 }, debug_path=True)
 parser_debug = factory_debug.parser(List[Todo])
 
+# my debug with reparsing
+factory_reparse = Factory(schemas={
+    Todo: DSchema(
+        name_mapping={"desc": "description"}
+    )
+}, debug_path=True, reparse_on_error=True)
+parser_reparse = factory_reparse.parser(List[Todo])
+
+# my trusted
+parser_trusted = factory.parser(List[Todo], trusted=True)
+
 
 # pydantic
 class PydTodo(BaseModel):
@@ -89,6 +100,14 @@ def do1_debug():
     return parser_debug(todos)
 
 
+def do1_reparse():
+    return parser_reparse(todos)
+
+
+def do1_trusted():
+    return parser_trusted(todos)
+
+
 def do2():
     return todo_schema.load(todos)
 
@@ -105,6 +124,8 @@ assert do1() == do2()
 
 print("my       ", timeit("do()", globals={"do": do1}, number=100000))  # 1.5959172130096704
 print("my debug ", timeit("do()", globals={"do": do1_debug}, number=100000))  # 2.087571810989175
+print("my reparse", timeit("do()", globals={"do": do1_reparse}, number=100000))  # 1.6929187320009805
+print("my trust ", timeit("do()", globals={"do": do1_trusted}, number=100000))  # 1.2254301930038491
 print("mashumaro", timeit("do()", globals={"do": do4}, number=100000))  # 1.459100882988423
 print("marsh    ", timeit("do()", globals={"do": do2}, number=100000))  # 21.77947078004945
 print("mpydantic", timeit("do()", globals={"do": do3}, number=100000))  # 7.471431287995074
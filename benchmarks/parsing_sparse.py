@@ -0,0 +1,34 @@
+from dataclasses import make_dataclass, field
+from timeit import timeit
+from typing import Optional
+
+from dataclass_factory import Factory
+from dataclass_factory import parsers
+
+# wide class with optional fields, data contains only some of them
+Profile = make_dataclass("Profile", [
+    (f"field_{i}", Optional[int], field(default=None))
+    for i in range(400)
+])
+sparse_data = {f"field_{i}": i for i in range(0, 400, 40)}
+dense_data = {f"field_{i}": i for i in range(400)}
+
+parser = Factory().parser(Profile)
+
+# checking all fields for each data
+sparse_min_fields = parsers.SPARSE_MIN_FIELDS
+parsers.SPARSE_MIN_FIELDS = 10 ** 6
+parser_all_fields = Factory().parser(Profile)
+parsers.SPARSE_MIN_FIELDS = sparse_min_fields
+
+assert parser(sparse_data) == parser_all_fields(sparse_data)
+
+
+def measure(parser, data) -> float:
+    return timeit("parser(data)", globals={"parser": parser, "data": data}, number=10000)
+
+
+print("sparse    ", measure(parser, sparse_data))  # 0.4947100429999409
+print("sparse all", measure(parser_all_fields, sparse_data))  # 0.7027775449998899
+print("dense     ", measure(parser, dense_data))  # 2.851078957000027
+print("dense all ", measure(parser_all_fields, dense_data))  # 2.8697849640000186
@@ -0,0 +1,43 @@
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import List
+
+from dataclass_factory import Factory, NameStyle, Schema
+
+
+@dataclass
+class Record:
+    record_id: int
+    currency_code: str
+    status_name: str
+    region_name: str
+    amount: float
+
+
+# flattened dicts are unmarshalled from a prepared structure, so their keys are shared only if they are interned
+factory = Factory(default_schema=Schema(
+    name_style=NameStyle.camel_lower,
+    name_mapping={"region_name": ("location", "region_name")},
+))
+serializer = factory.serializer(List[Record])
+records = [Record(i, "USD", "active", "eu", i / 10) for i in range(100000)]
+
+
+def measure(func) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result
+    return size
+
+
+keys_sample = serializer(records[:2])
+print("keys shared:", all(
+    a is b
+    for a, b in zip([*keys_sample[0], *keys_sample[0]["location"]], [*keys_sample[1], *keys_sample[1]["location"]])
+))
+print("bytes per serialized record:", measure(lambda: serializer(records)) / len(records))
+print("bytes per plain dict record:", measure(lambda: [vars(x).copy() for x in records]) / len(records))
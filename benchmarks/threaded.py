@@ -0,0 +1,47 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import List
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Todo:
+    id: int
+    title: str
+    desc: str
+
+
+factory = Factory()
+parser = factory.parser(List[Todo])
+serializer = factory.serializer(List[Todo])
+
+todos = [{
+    "id": i,
+    "title": "title %s" % i,
+    "desc": "5some long description %s %s %s" % (i, i * 10, i)
+} for i in range(100)]
+ITERATIONS = 2000
+
+
+def work(_):
+    for _ in range(ITERATIONS):
+        serializer(parser(todos))
+
+
+def measure(threads: int) -> float:
+    with ThreadPoolExecutor(threads) as executor:
+        start = perf_counter()
+        list(executor.map(work, range(threads)))
+        return perf_counter() - start
+
+
+gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+print("GIL enabled:", gil_enabled)
+base = measure(1)
+for threads in (1, 2, 4, 8):
+    elapsed = measure(threads)
+    # with linear scaling each thread does the same work at the same time
+    print(f"threads={threads} time={elapsed:.3f}s scaling={threads * base / elapsed:.2f}x")
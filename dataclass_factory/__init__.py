@@ -1,11 +1,14 @@
+from typing import Any
+
+from .bulk import LoadManyResult
 from .common import AbstractFactory
-from .deprecated_stuff import dict_factory, parse, ParserFactory, SerializerFactory
 from .exceptions import InvalidFieldError, UnknownFieldsError
 from .factory import Factory
 from .naming import NameStyle
 from .parsers import PARSER_EXCEPTIONS
+from .projection import SKIPPED
 from .schema import RuleForUnknown, Schema, Unknown
-from .validators import validate
+from .validators import validate, validate_batch
 
 __all__ = [
     "parse",
@@ -15,11 +18,24 @@ __all__ = [
     "NameStyle",
     "Schema",
     "Factory",
+    "LoadManyResult",
     "AbstractFactory",
     "PARSER_EXCEPTIONS",
+    "SKIPPED",
     "InvalidFieldError",
     "RuleForUnknown",
     "UnknownFieldsError",
     "Unknown",
     "validate",
+    "validate_batch",
 ]
+
+# deprecated names are imported on first access
+_DEPRECATED_NAMES = {"dict_factory", "parse", "ParserFactory", "SerializerFactory"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _DEPRECATED_NAMES:
+        from . import deprecated_stuff
+        return getattr(deprecated_stuff, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
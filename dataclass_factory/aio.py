@@ -0,0 +1,156 @@
+import asyncio
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional, Tuple, Type
+
+from .common import T
+from .generics import fix_generic_alias
+from .parsers import dyn_element_parser, get_batch_validator, get_collection_factory
+from .type_detection import args_unspecified, hasargs, is_dict, is_iterable, is_tuple
+
+
+def get_collection_plan(class_: Type) -> Optional[Tuple[Callable, Any]]:
+    """
+    Returns collection factory and item type if `class_` is homogeneous collection
+    which can be processed item by item. Otherwise returns None
+    """
+    class_ = fix_generic_alias(class_)
+    if class_ in (str, bytes, bytearray) or is_dict(class_):
+        return None
+    if is_tuple(class_):
+        if hasargs(class_) and len(class_.__args__) == 2 and class_.__args__[1] is Ellipsis:
+            return tuple, class_.__args__[0]
+        return None
+    if not is_iterable(class_):
+        return None
+    try:
+        collection_factory = get_collection_factory(class_)
+    except NotImplementedError:
+        return None
+    if args_unspecified(class_):
+        return collection_factory, Any
+    return collection_factory, class_.__args__[0]
+
+
+def has_custom_steps(schema, *attrs: str) -> bool:
+    return any(getattr(schema, attr) for attr in attrs)
+
+
+async def run_in_executor(executor: Optional[Executor], func: Callable, data: Any):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, data)
+
+
+async def process_chunked(
+    item_converter: Callable,
+    data: Any,
+    chunk_size: int,
+    debug_path: bool,
+) -> list:
+    result: list = []
+    iterator = iter(data)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return result
+        if debug_path:
+            result.extend(
+                dyn_element_parser(item_converter, x, i)
+                for i, x in enumerate(chunk, start)
+            )
+        else:
+            result.extend(item_converter(x) for x in chunk)
+        start += len(chunk)
+        await asyncio.sleep(0)
+
+
+def get_size(data: Any, limit: int) -> int:
+    """
+    Counts items of all nested lists, tuples, sets and dicts of `data`.
+    Counting stops as soon as `limit` is exceeded, so big payloads are not walked through completely
+    """
+    size = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            item = item.values()
+        elif not isinstance(item, (list, tuple, set, frozenset)):
+            continue
+        size += len(item)
+        if size > limit:
+            return size
+        stack.extend(item)
+    return size
+
+
+async def load_async(
+    factory,
+    data: Any,
+    class_: Type[T],
+    chunk_size: int,
+    offload_threshold: Optional[int],
+    executor: Optional[Executor],
+) -> T:
+    parser = factory.parser(class_)
+    size = get_size(data, max(chunk_size, offload_threshold or 0))
+    if offload_threshold is not None and size > offload_threshold:
+        return await run_in_executor(executor, parser, data)
+    if size <= chunk_size:
+        return parser(data)
+
+    plan = get_collection_plan(class_)
+    schema = factory.schema(class_)
+    if not plan or has_custom_steps(schema, "parser", "get_parser", "pre_parse", "post_parse"):
+        return parser(data)
+    collection_factory, item_type = plan
+    items = await process_chunked(factory.parser(item_type), data, chunk_size, factory.debug_path)
+    result = collection_factory(items)
+    batch_validator = get_batch_validator(factory, item_type)
+    if batch_validator is not None:
+        batch_validator(result)
+    return result
+
+
+async def dump_async(
+    factory,
+    data: T,
+    class_: Type[T],
+    chunk_size: int,
+    offload_threshold: Optional[int],
+    executor: Optional[Executor],
+) -> Any:
+    serializer = factory.serializer(class_)
+    size = get_size(data, max(chunk_size, offload_threshold or 0))
+    if offload_threshold is not None and size > offload_threshold:
+        return await run_in_executor(executor, serializer, data)
+    if size <= chunk_size:
+        return serializer(data)
+
+    plan = get_collection_plan(class_)
+    schema = factory.schema(class_)
+    if not plan or has_custom_steps(schema, "serializer", "get_serializer", "pre_serialize", "post_serialize"):
+        return serializer(data)
+    _, item_type = plan
+    return await process_chunked(factory.serializer(item_type), data, chunk_size, False)
+
+
+async def iter_load_async(
+    factory,
+    source: AsyncIterable,
+    class_: Type[T],
+    loads: Optional[Callable[[Any], Any]],
+    chunk_size: int,
+) -> AsyncIterator[T]:
+    parser = factory.parser(class_)
+    count = 0
+    async for item in source:
+        if loads is not None:
+            if not item.strip():
+                continue
+            item = loads(item)
+        yield parser(item)
+        count += 1
+        if count % chunk_size == 0:
+            await asyncio.sleep(0)
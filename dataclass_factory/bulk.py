@@ -0,0 +1,156 @@
+from dataclasses import dataclass, field, MISSING
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, Type
+
+from .common import T
+from .exceptions import InvalidFieldError
+from .fields import FieldInfo, get_dataclass_fields, get_namedtuple_fields, get_typeddict_fields
+from .generics import fix_generic_alias
+from .parsers import dyn_element_parser, get_batch_validator, PARSER_EXCEPTIONS
+from .type_detection import classify, TypeKind
+from .validators import combine_parser_validators
+
+ErrorPath = Tuple[str, ...]
+ERROR_MODES = ("raise", "collect")
+
+
+@dataclass
+class LoadManyResult(Generic[T]):
+    """
+    Result of parsing many rows.
+
+    `items` contains parsed rows in original order except invalid ones.
+    `errors` maps index of each invalid row to messages by path to broken fields in that row.
+    Empty path means that error is not related to a single field.
+    `batch_errors` contains messages of failed batch validators by path to checked field
+    """
+    items: List[T] = field(default_factory=list)
+    errors: Dict[int, Dict[ErrorPath, str]] = field(default_factory=dict)
+    batch_errors: Dict[ErrorPath, str] = field(default_factory=dict)
+
+
+def get_row_fields(schema, class_: Any) -> Optional[Sequence[FieldInfo]]:
+    if schema.parser or schema.get_parser or schema.pre_parse:
+        return None
+    kind = classify(class_)
+    if kind is TypeKind.DATACLASS:
+        return get_dataclass_fields(schema, class_)
+    if kind is TypeKind.NAMEDTUPLE:
+        return get_namedtuple_fields(schema, class_)
+    if kind is TypeKind.TYPEDDICT:
+        return get_typeddict_fields(schema, class_)
+    return None
+
+
+def error_path(data_name: Any) -> ErrorPath:
+    if isinstance(data_name, tuple):
+        return tuple(str(x) for x in data_name)
+    return (str(data_name),)
+
+
+def exception_errors(error: Exception, prefix: ErrorPath = ()) -> Dict[ErrorPath, str]:
+    if isinstance(error, InvalidFieldError):
+        return {prefix + tuple(reversed(error.field_path)): error.message}
+    return {prefix: str(error)}
+
+
+def collect_errors(factory, class_: Any, data: Any) -> Dict[ErrorPath, str]:
+    """
+    Finds errors in all fields of invalid row. Nested structures are reported up to the first error
+    """
+    class_ = fix_generic_alias(class_)
+    schema = factory.schema(class_)
+    fields = get_row_fields(schema, class_)
+    if fields is not None:
+        required = classify(class_) is not TypeKind.TYPEDDICT or getattr(class_, "__total__", True)
+        try:
+            errors = collect_field_errors(factory, schema, fields, required, data)
+        except PARSER_EXCEPTIONS:
+            errors = {}  # data has no expected structure
+        if errors:
+            return errors
+    try:
+        factory.parser(class_)(data)
+    except PARSER_EXCEPTIONS as e:
+        return exception_errors(e)
+    return {(): "Row cannot be parsed"}
+
+
+def collect_field_errors(
+    factory,
+    schema,
+    fields: Sequence[FieldInfo],
+    required: bool,
+    data: Any,
+) -> Dict[ErrorPath, str]:
+    errors: Dict[ErrorPath, str] = {}
+    aliases = schema.aliases or {}
+    for f in fields:
+        data_name = f.data_name
+        path = data_name if isinstance(data_name, tuple) else (data_name,)
+        value = data
+        try:
+            for key in path:
+                value = value[key]
+        except (KeyError, IndexError):
+            data_name = next((x for x in aliases.get(f.field_name, ()) if x in data), None)
+            if data_name is None:
+                if required and f.default is MISSING:
+                    errors[error_path(f.data_name)] = "Field is required"
+                continue
+            value = data[data_name]
+        parser = combine_parser_validators(
+            schema.pre_validators.get(f.field_name, []) + schema.pre_validators.get(None, []),
+            factory.parser(f.type),
+            schema.post_validators.get(f.field_name, []) + schema.post_validators.get(None, []),
+        )
+        try:
+            parser(value)
+        except PARSER_EXCEPTIONS as e:
+            errors.update(exception_errors(e, error_path(data_name)))
+    return errors
+
+
+def load_many(factory, data: Iterable[Any], class_: Type[T], errors: str) -> LoadManyResult[T]:
+    if errors not in ERROR_MODES:
+        raise ValueError(f"Invalid errors mode `{errors}`, expected one of {ERROR_MODES}")
+    parser = factory.parser(class_)
+    debug_factory = factory if factory.debug_path else None
+    result: LoadManyResult[T] = LoadManyResult()
+    append = result.items.append
+    for i, row in enumerate(data):
+        try:
+            append(parser(row))
+        except PARSER_EXCEPTIONS:
+            # rows are parsed again only if they are invalid, so valid ones are not slowed down
+            if debug_factory is None:
+                debug_factory = factory._variant(debug_path=True)
+            if errors == "raise":
+                dyn_element_parser(debug_factory.parser(class_), row, i)
+                raise
+            result.errors[i] = collect_errors(debug_factory, class_, row)
+    if errors == "raise":
+        batch_validator = get_batch_validator(factory, class_)
+        if batch_validator is not None:
+            batch_validator(result.items)
+    else:
+        result.batch_errors = collect_batch_errors(factory, class_, result.items)
+    return result
+
+
+def collect_batch_errors(factory, class_: Any, items: List[Any]) -> Dict[ErrorPath, str]:
+    """
+    Calls batch validators of each field separately, so all failed checks are reported
+    """
+    schema = factory.schema(class_)
+    data_names = {f.field_name: f.data_name for f in get_row_fields(schema, class_) or ()}
+    errors: Dict[ErrorPath, str] = {}
+    for field_name in schema.batch_validators or ():
+        batch_validator = get_batch_validator(factory, class_, (field_name,))
+        if batch_validator is None:
+            continue
+        try:
+            batch_validator(items)
+        except PARSER_EXCEPTIONS as e:
+            path = () if field_name is None else error_path(data_names.get(field_name, field_name))
+            errors[path] = str(e)
+    return errors
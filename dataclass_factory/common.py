@@ -4,6 +4,9 @@ from typing import Any, Callable, Type, TypeVar
 T = TypeVar("T")
 K = TypeVar("K")
 
+# number of items processed by async methods before giving control back to the event loop
+DEFAULT_CHUNK_SIZE = 1000
+
 
 class AbstractFactory:
     """
@@ -15,6 +18,9 @@ class AbstractFactory:
     def serializer(self, class_: Type):
         raise NotImplementedError
 
+    def schema(self, class_: Type):
+        raise NotImplementedError
+
     def json_schema(self, class_: Type):
         raise NotImplementedError
 
@@ -0,0 +1,116 @@
+# Constructors used to create instances without calling `__init__`.
+# They receive dict with values of init-fields and fill attributes of created object directly
+import inspect
+from dataclasses import fields, MISSING
+from typing import Any, Callable, Collection, Dict, Optional, Type
+
+from .common import T
+from .lazy import LAZY_DATA
+from .type_detection import is_generic_concrete
+
+Constructor = Callable[[Dict[str, Any]], T]
+
+
+def missing_argument(cls: Type, name: str) -> TypeError:
+    return TypeError(f"{cls.__name__}.__init__() missing required argument: '{name}'")
+
+
+def has_initvars(cls: Type) -> bool:
+    post_init = getattr(cls, "__post_init__", None)
+    if post_init is None:
+        return False
+    return len(inspect.signature(post_init).parameters) > 1
+
+
+def can_bypass_dataclass_init(cls: Type) -> bool:
+    if is_generic_concrete(cls):
+        cls = cls.__origin__
+    return not has_initvars(cls)
+
+
+def get_dataclass_constructor(  # noqa C901
+    cls: Type[T],
+    instance_class: Optional[Type] = None,
+    raw_names: Collection[str] = (),
+) -> Constructor[T]:
+    """
+    :param instance_class: class of created instance, `cls` is used if None.
+    :param raw_names: fields which values are not set but stored in lazy data of created instance
+    """
+    alias = None
+    if is_generic_concrete(cls):
+        alias = cls
+        cls = cls.__origin__  # type: ignore
+
+    all_fields = fields(cls)
+    init_count = sum(1 for f in all_fields if f.init)
+    required = frozenset(
+        f.name for f in all_fields
+        if f.init and f.default is MISSING and f.default_factory is MISSING  # type: ignore
+    )
+    defaults = {f.name: f.default for f in all_fields if f.default is not MISSING}
+    default_factories = tuple(
+        (f.name, f.init, f.default_factory)  # type: ignore
+        for f in all_fields if f.default_factory is not MISSING  # type: ignore
+    )
+    has_post_init = hasattr(cls, "__post_init__")
+    if instance_class is None:
+        instance_class = cls
+    new = object.__new__
+    use_dict = hasattr(new(cls), "__dict__")
+    setter = object.__setattr__
+
+    # values contain only init-fields, so all of them are present if the size matches
+    def dataclass_constructor(values: Dict[str, Any]) -> T:
+        if len(values) != init_count and not required.issubset(values):
+            name = next(x for x in required if x not in values)
+            raise missing_argument(cls, name)
+        obj = new(instance_class)
+        attrs = obj.__dict__ if use_dict else {}
+        attrs.update(defaults)
+        attrs.update(values)
+        for name, init, default_factory in default_factories:
+            if not init or name not in values:
+                attrs[name] = default_factory()
+        if raw_names:
+            setter(obj, LAZY_DATA, {
+                name: attrs.pop(name)
+                for name in raw_names
+                if name in values
+            })
+        if not use_dict:
+            for name, value in attrs.items():
+                setter(obj, name, value)
+        if alias is not None:
+            try:
+                obj.__orig_class__ = alias
+            except AttributeError:
+                pass
+        if has_post_init:
+            obj.__post_init__()
+        return obj
+
+    return dataclass_constructor
+
+
+def get_namedtuple_constructor(cls: Type[T]) -> Constructor[T]:
+    # There is no _field_defaults in python 3.6 for `namedtuple()`
+    defaults = getattr(cls, "_field_defaults", {})
+    plan = [(name, defaults.get(name, MISSING)) for name in cls._fields]  # type: ignore
+    names = cls._fields  # type: ignore
+    new = tuple.__new__
+
+    def namedtuple_constructor(values: Dict[str, Any]) -> T:
+        if len(values) == len(names):
+            return new(cls, [values[name] for name in names])
+        items = []
+        for name, default in plan:
+            if name in values:
+                items.append(values[name])
+            elif default is not MISSING:
+                items.append(default)
+            else:
+                raise missing_argument(cls, name)
+        return new(cls, items)
+
+    return namedtuple_constructor
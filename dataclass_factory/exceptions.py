@@ -1,4 +1,15 @@
-from typing import Any, List, Set, Tuple
+from typing import Any, List, Set, Tuple, Union
+
+# parsed data is shown in error messages only partially
+MAX_EXCERPT_LENGTH = 200
+_NO_DATA = object()
+
+
+def data_excerpt(data: Any) -> str:
+    res = str(data)
+    if len(res) > MAX_EXCERPT_LENGTH:
+        return res[:MAX_EXCERPT_LENGTH - 3] + "..."
+    return res
 
 
 class ParseError(ValueError):
@@ -6,14 +17,30 @@ class ParseError(ValueError):
 
 
 class InvalidFieldError(ParseError):
-    def __init__(self, message: str, field_path: List[str]):
+    """
+    Error with path to invalid field.
+    Original error is converted to message string only when it is requested
+    """
+
+    def __init__(self, message: Union[str, Exception], field_path: List[str]):
         super().__init__(message, field_path)
-        self.message = message
+        self._message = message
         self.field_path = field_path
 
+    @property
+    def message(self) -> str:
+        return str(self._message)
+
+    @message.setter
+    def message(self, value: str):
+        self._message = value
+
     def _append_path(self, *path: str):
         self.field_path.extend(path)
 
+    def __reduce__(self):
+        return InvalidFieldError, (self.message, self.field_path)
+
     def __str__(self):
         path = ", ".join(self.field_path)
         return f"Invalid data at path [{path}]: {self.message}"
@@ -30,11 +57,31 @@ class UnknownFieldsError(ParseError):
 
 
 class UnionParseError(ParseError):
-    def __init__(self, message: str, suberrors: List[Tuple[Any, Exception]]):
+    """
+    Error of parsing union.
+    If `data` is passed, message is formatted with it (shortened if needed) only when requested
+    """
+
+    def __init__(self, message: str, suberrors: List[Tuple[Any, Exception]], data: Any = _NO_DATA):
         super().__init__(message, suberrors)
-        self.message = message
+        self._message = message
+        self._data = data
         self.suberrors = suberrors
 
+    @property
+    def message(self) -> str:
+        if self._data is _NO_DATA:
+            return self._message
+        return self._message % (data_excerpt(self._data),)
+
+    @message.setter
+    def message(self, value: str):
+        self._message = value
+        self._data = _NO_DATA
+
+    def __reduce__(self):
+        return UnionParseError, (self.message, self.suberrors)
+
     def __str__(self):
         res = f"{self.message}\nSuberrors:\n"
         for key, error in self.suberrors:
@@ -1,14 +1,23 @@
-from copy import copy
-from typing import Any, Dict, Optional, Type, TypeVar
+import json
+from threading import RLock
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Collection, Dict, FrozenSet,
+    Iterable, Optional, Tuple, Type, TypeVar, TYPE_CHECKING,
+)
 
-from .common import AbstractFactory, Parser, Serializer
-from .jsonschema import create_schema, need_ref
+from .bulk import load_many, LoadManyResult
+from .common import AbstractFactory, DEFAULT_CHUNK_SIZE, Parser, Serializer
+from .lazy import get_lazy_origin
 from .naming import NameStyle
-from .parsers import create_parser, get_lazy_parser
-from .schema import merge_schema, Schema, Unknown
+from .parsers import create_parser, get_lazy_parser, get_reparsing_parser
+from .projection import make_projection, ProjectionBuilder
+from .schema import merge_schema, resolve_schema, Schema, SchemaProxy, Unknown
 from .serializers import create_serializer, get_lazy_serializer
 from .type_detection import is_generic_concrete
-from .schema_helpers import COMMON_SCHEMAS
+from .schema_helpers import get_common_schema
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 DEFAULT_SCHEMA = Schema[Any](
     trim_trailing_underscore=True,
@@ -17,6 +26,8 @@ DEFAULT_SCHEMA = Schema[Any](
     name_style=NameStyle.ignore,
     unknown=Unknown.SKIP,
 )
+# applied to types without own settings when they are parsed inside of strict class
+STRICT_SCHEMA = Schema[Any](strict=True)
 
 
 class StackedFactory(AbstractFactory):
@@ -38,6 +49,9 @@ class StackedFactory(AbstractFactory):
         finally:
             self.stack.pop()
 
+    def schema(self, class_: Type):
+        return self.factory.schema(class_)
+
     def parser(self, class_: Type):
         if class_ in self.stack:
             return get_lazy_parser(self.factory, class_)
@@ -47,6 +61,12 @@ class StackedFactory(AbstractFactory):
         finally:
             self.stack.pop()
 
+    def checked_parser(self, class_: Type):
+        """
+        Returns parser which checks data even if the factory is trusted
+        """
+        return self.factory.parser(class_, trusted=False)
+
     def serializer(self, class_: Type):
         if class_ in self.stack:
             return get_lazy_serializer(self.factory)
@@ -70,6 +90,8 @@ class Factory(AbstractFactory):
         schemas: Optional[Dict[Type, Schema]] = None,
         debug_path: bool = False,
         json_schema_definitions_path: str = "/definitions",
+        trusted: bool = False,
+        reparse_on_error: bool = False,
     ):
         """
 
@@ -81,11 +103,21 @@ class Factory(AbstractFactory):
                            (InvalidFieldError will be raised)
         :param json_schema_definitions_path: path to definitions of jsonschemas
                        in overall schema, used by $ref
+        :param trusted: expect parsed data to be well-typed (e.g. it is read from own storage).
+                        Primitive values are not checked or converted, only structures are parsed
+        :param reparse_on_error: used with `debug_path`. Data is parsed without path tracking
+                                 and parsed again to find path to broken field only if it fails.
+                                 Successful parsing is as fast as without `debug_path`,
+                                 but parsers and validators are called twice for invalid data
 
         """
         self.debug_path = debug_path
+        self.trusted = trusted
+        self.reparse_on_error = reparse_on_error
+        # set in variants used to parse fields of classes with `strict` schema
+        self._strict = False
         self.default_schema = default_schema
-        self.schemas: Dict[Type, Schema] = COMMON_SCHEMAS.copy()
+        self.schemas: Dict[Type, Schema] = {}
         if schemas:
             self.schemas.update({
                 type_: merge_schema(schema, self.default_schema, DEFAULT_SCHEMA)
@@ -94,46 +126,165 @@ class Factory(AbstractFactory):
         self.json_schemas: Dict[str, Dict] = {}
         self.json_schema_names: Dict[str, Type] = {}
         self.json_schema_definitions_path = json_schema_definitions_path
+        # Converters are created once and then used by many threads.
+        # Each of them is stored only when it is completely built, schemas are never modified
+        self._lock = RLock()
+        self._parsers: Dict[Type, Parser] = {}
+        self._serializers: Dict[Type, Serializer] = {}
+        self._projected_parsers: Dict[Tuple[Type, FrozenSet[str]], Parser] = {}
+        self._reparsing_parsers: Dict[Tuple[Type, Optional[FrozenSet[str]]], Parser] = {}
+        self._variants: Dict[Tuple[Tuple[str, Any], ...], "Factory"] = {}
+
+    def _variant(self, **options: Any) -> "Factory":
+        """
+        Returns factory with same schemas but other options (like `trusted`).
+        It has its own converters and is created once
+        """
+        key = tuple(sorted(options.items()))
+        variant = self._variants.get(key)
+        if variant:
+            return variant
+
+        with self._lock:
+            variant = self._variants.get(key)
+            if not variant:
+                params = dict(
+                    debug_path=self.debug_path,
+                    json_schema_definitions_path=self.json_schema_definitions_path,
+                    trusted=self.trusted,
+                    reparse_on_error=self.reparse_on_error,
+                )
+                params.update(options)
+                strict = params.pop("strict", self._strict)
+                variant = Factory(self.default_schema, **params)
+                variant._strict = strict
+                variant.schemas = self.schemas.copy()  # they are already merged with defaults
+                self._variants[key] = variant
+        return variant
+
+    def _strict_variant(self, strict: bool) -> "Factory":
+        """
+        Returns factory which parses primitive values strictly unless it is disabled in their schemas
+        """
+        if strict == self._strict:
+            return self
+        return self._variant(strict=strict)
 
     def schema(self, class_: Type[T]) -> Schema[T]:
         """
         Finds or creates `Schema` describing `class_` conversion rules
         """
+        schema = self.schemas.get(class_)
+        if schema and not isinstance(schema, SchemaProxy):
+            return schema
+
         if is_generic_concrete(class_):
             base_class = class_.__origin__  # type: ignore
         else:
             base_class = None
 
-        schema = self.schemas.get(class_)
-        if not schema:
-            if base_class:
-                schema = self.schemas.get(base_class)
+        with self._lock:
+            schema = self.schemas.get(class_)
+            if isinstance(schema, SchemaProxy):
+                # schemas are resolved on first lookup, so converters are created reading plain attributes
+                schema = resolve_schema(schema)
+                self.schemas[class_] = schema
+            lazy_origin = get_lazy_origin(class_)
+            if not schema and lazy_origin:
+                # instances of lazy classes are processed as their origins
+                schema = self.schema(lazy_origin)
+                self.schemas[class_] = schema
             if not schema:
-                schema = Schema()
-            schema = merge_schema(schema, self.default_schema, DEFAULT_SCHEMA)
-            self.schemas[class_] = schema
+                schema = get_common_schema(class_)  # type: ignore
+                if schema:
+                    self.schemas[class_] = schema
+            if not schema:
+                if base_class:
+                    schema = self.schemas.get(base_class)
+                if not schema:
+                    schema = Schema()
+                schema = resolve_schema(schema, self.default_schema, DEFAULT_SCHEMA)
+                self.schemas[class_] = schema
         return schema
 
-    def parser(self, class_: Type[T]) -> Parser[T]:
+    def parser(
+        self,
+        class_: Type[T],
+        include: Optional[Collection[str]] = None,
+        trusted: Optional[bool] = None,
+    ) -> Parser[T]:
         """
         Returns preconfigure parser to create `class_` instances
         from simple data structures using previously set schemas
+
+        :param include: paths of fields to be parsed, like `id`, `customer.name` or `lines[].sku`.
+                        Other fields are skipped: they get default values or `SKIPPED` if there is no default
+        :param trusted: overrides `trusted` option of factory
         """
+        if trusted is not None and trusted != self.trusted:
+            return self._variant(trusted=trusted).parser(class_, include)
+        if self.debug_path and self.reparse_on_error:
+            return self._reparsing_parser(class_, None if include is None else frozenset(include))
+        if include is not None:
+            return self._projected_parser(class_, frozenset(include))
         return self._parser_with_stack(class_, StackedFactory(self))
 
-    def _parser_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Parser[T]:
-        schema = self.schema(class_)
-
-        if not schema.parser:
-            if schema.get_parser:
-                new_schema = copy(schema)
-                new_schema.parser = schema.get_parser(class_, stacked_factory, self.debug_path)
-                self.schemas[class_] = new_schema
-                schema = new_schema
-            else:
-                schema.parser = create_parser(stacked_factory, schema, self.debug_path, class_)
+    def _reparsing_parser(self, class_: Type[T], include: Optional[FrozenSet[str]]) -> Parser[T]:
+        key = (class_, include)
+        parser = self._reparsing_parsers.get(key)
+        if parser:
+            return parser
+
+        with self._lock:
+            parser = self._reparsing_parsers.get(key)
+            if not parser:
+                # debug parser is created only when it is needed
+                def get_debug_parser() -> Parser[T]:
+                    if include is None:
+                        return self._parser_with_stack(class_, StackedFactory(self))
+                    return self._projected_parser(class_, include)
+
+                fast_parser = self._variant(debug_path=False).parser(class_, include)
+                parser = get_reparsing_parser(fast_parser, get_debug_parser)
+                self._reparsing_parsers[key] = parser
+        return parser
+
+    def _projected_parser(self, class_: Type[T], include: FrozenSet[str]) -> Parser[T]:
+        key = (class_, include)
+        parser = self._projected_parsers.get(key)
+        if parser:
+            return parser
+
+        with self._lock:
+            parser = self._projected_parsers.get(key)
+            if not parser:
+                builder = ProjectionBuilder(self, self.debug_path)
+                parser = builder.parser(class_, make_projection(include))
+                self._projected_parsers[key] = parser
+        return parser
 
-        return schema.parser  # type: ignore
+    def _parser_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Parser[T]:
+        parser = self._parsers.get(class_)
+        if parser:
+            return parser
+
+        with self._lock:
+            parser = self._parsers.get(class_)
+            if not parser:
+                schema = self.schema(class_)
+                if schema.parser:
+                    parser = schema.parser
+                elif schema.get_parser:
+                    parser = schema.get_parser(class_, stacked_factory, self.debug_path)
+                else:
+                    if schema.strict is not None and bool(schema.strict) != self._strict:
+                        # strictness of class is applied to all nested types
+                        stacked_factory = StackedFactory(self._strict_variant(bool(schema.strict)))
+                    elif self._strict and schema.strict is None and not schema.pre_parse and not schema.post_parse:
+                        schema = resolve_schema(schema, STRICT_SCHEMA)
+                    parser = create_parser(stacked_factory, schema, self.debug_path, class_, self.trusted)
+                self._parsers[class_] = parser
+        return parser  # type: ignore
 
     def json_schema_ref_name(self, class_: Type[T]):
         """
@@ -176,22 +327,26 @@ class Factory(AbstractFactory):
         once and their references
         """
 
-        return {
-            k: v
-            for k, v in self.json_schemas.items()
-        }
+        with self._lock:
+            return {
+                k: v
+                for k, v in self.json_schemas.items()
+            }
 
     def _json_schema_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Dict[str, Any]:
-        schema = self.schema(class_)
-        name = self._json_schema_ref_name_with_stack(class_, stacked_factory)
-        if name in self.json_schemas:
-            return self.json_schemas[name]
-        json_schema = create_schema(
-            stacked_factory, schema, class_, self.json_schema_definitions_path,
-        )
-        # we store schema only fot those types that can be referenced
-        if need_ref(class_):
-            self.json_schemas[name] = json_schema
+        from .jsonschema import create_schema, need_ref
+
+        with self._lock:
+            schema = self.schema(class_)
+            name = self._json_schema_ref_name_with_stack(class_, stacked_factory)
+            if name in self.json_schemas:
+                return self.json_schemas[name]
+            json_schema = create_schema(
+                stacked_factory, schema, class_, self.json_schema_definitions_path,
+            )
+            # we store schema only fot those types that can be referenced
+            if need_ref(class_):
+                self.json_schemas[name] = json_schema
         return json_schema
 
     def serializer(self, class_: Type[T]) -> Serializer[T]:
@@ -202,24 +357,40 @@ class Factory(AbstractFactory):
         return self._serializer_with_stack(class_, StackedFactory(self))
 
     def _serializer_with_stack(self, class_: Type[T], stacked_factory: StackedFactory) -> Serializer[T]:
-        schema = self.schema(class_)
-
-        if not schema.serializer:
-            if schema.get_serializer:
-                new_schema = copy(schema)
-                new_schema.serializer = schema.get_serializer(class_, stacked_factory, self.debug_path)
-                self.schemas[class_] = new_schema
-                schema = new_schema
-            else:
-                schema.serializer = create_serializer(stacked_factory, schema, self.debug_path, class_)
+        serializer = self._serializers.get(class_)
+        if serializer:
+            return serializer
+
+        with self._lock:
+            serializer = self._serializers.get(class_)
+            if not serializer:
+                schema = self.schema(class_)
+                if schema.serializer:
+                    serializer = schema.serializer
+                elif schema.get_serializer:
+                    serializer = schema.get_serializer(class_, stacked_factory, self.debug_path)
+                else:
+                    serializer = create_serializer(stacked_factory, schema, self.debug_path, class_)
+                self._serializers[class_] = serializer
+        return serializer  # type: ignore
+
+    def load(self, data: Any, class_: Type[T], trusted: Optional[bool] = None) -> T:
+        """
+        Create `class_` instance form `data`
 
-        return schema.serializer  # type: ignore
+        :param trusted: overrides `trusted` option of factory
+        """
+        return self.parser(class_, trusted=trusted)(data)
 
-    def load(self, data: Any, class_: Type[T]) -> T:
+    def load_many(self, data: Iterable[Any], class_: Type[T], errors: str = "raise") -> LoadManyResult[T]:
         """
-        Create `class_` instance form `data`
+        Create `class_` instance from each item of `data`.
+
+        :param errors: what to do with invalid items.
+                       `raise` - raise `InvalidFieldError` with item index in `field_path`,
+                       `collect` - skip invalid items and report errors of their fields by item index
         """
-        return self.parser(class_)(data)
+        return load_many(self, data, class_, errors)
 
     def dump(self, data: T, class_: Type[T] = None) -> Any:
         """
@@ -229,3 +400,64 @@ class Factory(AbstractFactory):
         if class_ is None:
             class_ = type(data)
         return self.serializer(class_)(data)
+
+    async def aload(
+        self,
+        data: Any,
+        class_: Type[T],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offload_threshold: Optional[int] = None,
+        executor: Optional["Executor"] = None,
+    ) -> T:
+        """
+        Create `class_` instance form `data` without blocking event loop for a long time.
+
+        Data with no more than `chunk_size` items (including items of nested lists and dicts) is parsed inline.
+        Bigger homogeneous collections are parsed by chunks of `chunk_size` items
+        giving control back to the event loop between them.
+
+        :param offload_threshold: if set, data with more items (including nested ones) is parsed in `executor` instead
+        :param executor: executor used for offloading, default executor of the loop if None
+        """
+        from .aio import load_async
+
+        return await load_async(self, data, class_, chunk_size, offload_threshold, executor)
+
+    async def adump(
+        self,
+        data: T,
+        class_: Type[T] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        offload_threshold: Optional[int] = None,
+        executor: Optional["Executor"] = None,
+    ) -> Any:
+        """
+        Convert `data` to plain structures without blocking event loop for a long time.
+        If `class_` is not provided then `type(data)` will be used.
+
+        See `aload` for the description of other arguments
+        """
+        if class_ is None:
+            class_ = type(data)
+        from .aio import dump_async
+
+        return await dump_async(self, data, class_, chunk_size, offload_threshold, executor)
+
+    def aload_iter(
+        self,
+        source: AsyncIterable,
+        class_: Type[T],
+        loads: Optional[Callable[[Any], Any]] = json.loads,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[T]:
+        """
+        Create `class_` instances from each item of async iterable `source`.
+        Suitable to read NDJSON from `asyncio.StreamReader` and similar sources.
+
+        :param loads: function to decode each item (e.g. line of text) before parsing.
+                      Blank items are skipped. Set to None if items are already decoded
+        :param chunk_size: number of items to be processed before giving control to the event loop
+        """
+        from .aio import iter_load_async
+
+        return iter_load_async(self, source, class_, loads, chunk_size)
@@ -1,7 +1,9 @@
 import inspect
-from dataclasses import dataclass, Field, fields, MISSING
+from dataclasses import dataclass, fields, MISSING
 from functools import partial
-from typing import Any, Callable, cast, Dict, List, Sequence, Type, TypeVar, Union
+from threading import Lock
+from typing import Any, Callable, cast, Dict, List, Sequence, Tuple, Type, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 from .generics import resolve_hints, resolve_init_hints
 from .naming import convert_name
@@ -24,11 +26,17 @@ class FieldInfo(BaseFieldInfo):
     data_name: Union[CleanKey, CleanPath]
 
 
-def get_dataclass_default(field: Field) -> Any:
-    # type ignore because of https://github.com/python/mypy/issues/6910
-    if field.default_factory != MISSING:  # type: ignore
-        return field.default_factory()  # type: ignore
-    return field.default
+# Raw introspection results: field name, type, default value and default factory.
+# Defaults produced by factories are created each time fields are requested, because they can be mutable
+RawField = Tuple[str, Any, Any, Any]
+RawFieldsGetter = Callable[[Any], List[RawField]]
+
+# Introspection of a class does not depend on schema, so it is shared by all factories.
+# Keys are classes (origins for generic aliases), values are dicts `(getter, type args) -> fields`.
+# Values reference field types, so a class mentioning itself in its fields is never released
+_introspection_cache: "WeakKeyDictionary[Any, Dict[Tuple[RawFieldsGetter, Any], List[RawField]]]"
+_introspection_cache = WeakKeyDictionary()
+_introspection_lock = Lock()
 
 
 def get_func_default(parameter: inspect.Parameter) -> Any:
@@ -38,7 +46,7 @@ def get_func_default(parameter: inspect.Parameter) -> Any:
     return parameter.default
 
 
-def all_dataclass_fields(cls) -> List[BaseFieldInfo]:
+def raw_dataclass_fields(cls) -> List[RawField]:
     if is_generic_concrete(cls):
         all_fields = fields(cls.__origin__)
     else:
@@ -46,50 +54,83 @@ def all_dataclass_fields(cls) -> List[BaseFieldInfo]:
     hints = resolve_hints(cls)
 
     return [
-        BaseFieldInfo(
-            field_name=f.name,
-            type=hints[f.name],
-            default=get_dataclass_default(f),
-        )
+        (f.name, hints[f.name], f.default, f.default_factory)  # type: ignore
         for f in all_fields if f.init
     ]
 
 
-def all_class_fields(cls) -> List[BaseFieldInfo]:
+def raw_class_fields(cls) -> List[RawField]:
     all_fields = inspect.signature(cls.__init__).parameters
     hints = resolve_init_hints(cls)
     return [
-        BaseFieldInfo(
-            field_name=f.name,
-            type=hints.get(f.name, Any),
-            default=get_func_default(f),
-        )
+        (f.name, hints.get(f.name, Any), get_func_default(f), MISSING)
         for f in all_fields.values()
     ]
 
 
-def all_namedtuple_fields(cls) -> List[BaseFieldInfo]:
+def raw_namedtuple_fields(cls) -> List[RawField]:
     hints = resolve_hints(cls)
     # There is no _field_defaults in python 3.6 for `namedtuple()`
     defaults = getattr(cls, "_field_defaults", {})
     return [
-        BaseFieldInfo(
-            field_name=fieldname,
-            type=hints.get(fieldname, Any),
-            default=defaults.get(fieldname, MISSING),
-        )
+        (fieldname, hints.get(fieldname, Any), defaults.get(fieldname, MISSING), MISSING)
         for fieldname in cls._fields
     ]
 
 
-def all_typeddict_fields(cls) -> List[BaseFieldInfo]:
+def raw_typeddict_fields(cls) -> List[RawField]:
     all_fields = resolve_hints(cls)
     return [
-        BaseFieldInfo(field_name=f, type=t, default=MISSING)
+        (f, t, MISSING, MISSING)
         for f, t in all_fields.items()
     ]
 
 
+def get_raw_fields(raw_getter: RawFieldsGetter, cls: Any) -> List[RawField]:
+    if is_generic_concrete(cls):
+        owner, key = cls.__origin__, (raw_getter, cls.__args__)
+    else:
+        owner, key = cls, (raw_getter, None)
+    try:
+        class_cache = _introspection_cache.get(owner)
+    except TypeError:  # cannot be weakly referenced
+        return raw_getter(cls)
+    if class_cache is not None and key in class_cache:
+        return class_cache[key]
+
+    raw_fields = raw_getter(cls)
+    with _introspection_lock:
+        class_cache = _introspection_cache.setdefault(owner, {})
+        return class_cache.setdefault(key, raw_fields)
+
+
+def get_all_fields(raw_getter: RawFieldsGetter, cls: Any) -> List[BaseFieldInfo]:
+    return [
+        BaseFieldInfo(
+            field_name=name,
+            type=type_,
+            default=default if default_factory is MISSING else default_factory(),
+        )
+        for name, type_, default, default_factory in get_raw_fields(raw_getter, cls)
+    ]
+
+
+def all_dataclass_fields(cls) -> List[BaseFieldInfo]:
+    return get_all_fields(raw_dataclass_fields, cls)
+
+
+def all_class_fields(cls) -> List[BaseFieldInfo]:
+    return get_all_fields(raw_class_fields, cls)
+
+
+def all_namedtuple_fields(cls) -> List[BaseFieldInfo]:
+    return get_all_fields(raw_namedtuple_fields, cls)
+
+
+def all_typeddict_fields(cls) -> List[BaseFieldInfo]:
+    return get_all_fields(raw_typeddict_fields, cls)
+
+
 def schema_fields_filter(schema: Schema, name: str):
     """Check if field is allowed by a schema.
 
@@ -1,7 +1,9 @@
 import sys
 from collections import deque
-from typing import Any, Dict, Generic, Type, get_type_hints, Tuple, List, Set, \
+from threading import Lock
+from typing import Any, Callable, Dict, Generic, Type, get_type_hints, Tuple, List, Set, \
     FrozenSet, Deque
+from weakref import WeakKeyDictionary
 
 from .type_detection import (
     get_self_type_hints, is_generic, is_generic_concrete,
@@ -22,6 +24,28 @@ else:
     COMPAT_ORIGINS = {}
 
 
+# Results of generic specialization: origin -> {(kind of result, type args) -> result}.
+# They are shared by all factories, origins are weakly referenced
+_specializations: "WeakKeyDictionary[Any, Dict[Tuple[str, Any], Any]]" = WeakKeyDictionary()
+_specializations_lock = Lock()
+
+
+def specialize(name: str, origin: Any, args: Any, compute: Callable[[], Any]) -> Any:
+    """
+    Returns `compute()` result, which is memoized for `origin` and `args`
+    """
+    key = (name, args)
+    try:
+        cache = _specializations.get(origin)
+        if cache is not None and key in cache:
+            return cache[key]
+    except TypeError:  # not hashable or cannot be weakly referenced
+        return compute()
+    result = compute()
+    with _specializations_lock:
+        return _specializations.setdefault(origin, {}).setdefault(key, result)
+
+
 def fill_type_args(args: Dict[Type, Type], type_: Type) -> Type:
     type_ = args.get(type_, type_)
     if is_generic_concrete(type_):
@@ -46,6 +70,10 @@ def resolve_generic_hints(type_: Type):
         return {}
     if not hasattr(type_, "__orig_bases__"):  # not real generic type like Protocol
         return {}
+    return specialize("hints", type_, None, lambda: _resolve_generic_hints(type_))
+
+
+def _resolve_generic_hints(type_: Type):
     res = {}
     for base in reversed(type_.__orig_bases__):
         base_hints = resolve_hints(base)
@@ -56,6 +84,10 @@ def resolve_generic_hints(type_: Type):
 
 
 def resolve_concrete_hints(type_: Type):
+    return specialize("hints", type_.__origin__, type_.__args__, lambda: _resolve_concrete_hints(type_))
+
+
+def _resolve_concrete_hints(type_: Type):
     hints = resolve_generic_hints(type_.__origin__)
     if not hints:
         return {}
@@ -70,6 +102,10 @@ def resolve_concrete_hints(type_: Type):
 def resolve_init_hints(type_: Any):
     if not is_generic_concrete(type_):
         return get_type_hints(type_.__init__)
+    return specialize("init_hints", type_.__origin__, type_.__args__, lambda: _resolve_init_hints(type_))
+
+
+def _resolve_init_hints(type_: Any):
     hints = get_type_hints(type_.__origin__.__init__)
     args = dict(zip(type_.__self__.__origin__.__parameters__, type_.__self__.__args__))
     return {
@@ -90,6 +126,11 @@ def fix_generic_alias(type_: Any):
     origin = type_.__origin__
     if not is_generic_concrete(origin):
         return type_
+    return specialize("alias", origin, type_.__args__, lambda: _fix_generic_alias(type_))
+
+
+def _fix_generic_alias(type_: Any):
+    origin = type_.__origin__
     args = dict(zip(origin.__parameters__, type_.__args__))
     origin_args = tuple(fill_type_args(args, a) for a in origin.__args__)
     return fix_generic_alias(origin.__origin__[origin_args])
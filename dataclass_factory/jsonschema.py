@@ -1,4 +1,4 @@
-from dataclasses import is_dataclass, MISSING
+from dataclasses import MISSING
 import decimal
 from typing import Any, Dict, Optional, Type
 
@@ -6,8 +6,8 @@ from .common import AbstractFactory
 from .fields import get_dataclass_fields, get_typeddict_fields
 from .schema import Schema, Unknown
 from .type_detection import (
-    hasargs, is_iterable, is_dict, is_enum, is_generic_concrete,
-    is_none, is_tuple, is_typeddict, is_union, is_literal,
+    classify, hasargs, is_iterable, is_dict, is_enum,
+    is_none, is_tuple, is_typeddict, is_union, is_literal, TypeKind,
 )
 
 
@@ -129,17 +129,16 @@ def create_schema(
     if type_:
         res["type"] = type_
 
-    if cls in (str, ):
+    kind = classify(cls)
+    if kind is TypeKind.PRIMITIVE:
         pass
-    elif cls in (int, float, complex, bool):
-        pass
-    elif is_enum(cls):
+    elif kind is TypeKind.ENUM:
         res["enum"] = [x.value for x in cls]
-    elif is_dict(cls):
+    elif kind is TypeKind.DICT:
         res["additionalProperties"] = type_or_ref(
             cls.__args__[1], factory, json_schema_definitions_path,
         )
-    elif is_tuple(cls):
+    elif kind is TypeKind.TUPLE:
         if hasargs(cls):
             if len(cls.__args__) == 2 and cls.__args__[1] is Ellipsis:
                 res["items"] = type_or_ref(
@@ -150,19 +149,19 @@ def create_schema(
                     type_or_ref(x, factory, json_schema_definitions_path)
                     for x in cls.__args__
                 ]
-    elif is_typeddict(cls) or (is_generic_concrete(cls) and is_typeddict(cls.__origin__)):
+    elif kind is TypeKind.TYPEDDICT:
         res.update(typed_dict_schema(factory, schema, cls, json_schema_definitions_path))
-    elif is_iterable(cls):
+    elif kind is TypeKind.ITERABLE:
         res["items"] = type_or_ref(
             cls.__args__[0], factory, json_schema_definitions_path,
         )
-    elif is_union(cls):
+    elif kind is TypeKind.UNION:
         res["anyOf"] = [
             type_or_ref(x, factory, json_schema_definitions_path)
             for x in cls.__args__
         ]
     elif is_literal(cls):
         res["enum"] = list(factory.serializer(type(x))(x) for x in cls.__args__)
-    elif is_dataclass(cls) or (is_generic_concrete(cls) and is_dataclass(cls.__origin__)):
+    elif kind is TypeKind.DATACLASS:
         res.update(dataclass_schema(factory, schema, cls, json_schema_definitions_path))
     return res
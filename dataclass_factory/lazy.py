@@ -0,0 +1,117 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, Optional, Type
+
+from .common import Parser
+from .type_detection import (
+    is_dict, is_generic_concrete, is_iterable, is_namedtuple, is_newtype,
+    is_tuple, is_typeddict, is_union,
+)
+
+LAZY_ORIGIN = "__lazy_origin__"
+LAZY_DATA = "__lazy_data__"
+
+
+def is_lazy_type(type_: Any) -> bool:
+    """
+    Checks if parsing of `type_` can be postponed.
+    Only types which contain nested structures are processed lazily
+    """
+    if type_ in (str, bytes, bytearray):
+        return False
+    if is_newtype(type_):
+        return is_lazy_type(type_.__supertype__)
+    if is_union(type_):
+        return any(is_lazy_type(x) for x in type_.__args__)
+    if is_generic_concrete(type_):
+        origin = type_.__origin__
+        if is_dataclass(origin) or is_typeddict(origin):
+            return True
+    return (
+        is_dataclass(type_) or is_typeddict(type_) or is_namedtuple(type_) or
+        is_tuple(type_) or is_dict(type_) or is_iterable(type_)
+    )
+
+
+def supports_lazy(cls: Type) -> bool:
+    if is_generic_concrete(cls):
+        cls = cls.__origin__
+    return hasattr(object.__new__(cls), "__dict__")
+
+
+def get_lazy_origin(cls: Any) -> Optional[Type]:
+    if isinstance(cls, type):
+        return cls.__dict__.get(LAZY_ORIGIN)
+    return None
+
+
+class LazyField:
+    """
+    Descriptor which parses stored raw value on first access
+    and saves result in instance `__dict__`
+    """
+    __slots__ = ("name", "parser", "owner")
+
+    def __init__(self, name: str, parser: Parser, owner: Type):
+        self.name = name
+        self.parser = parser
+        self.owner = owner
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return getattr(self.owner, self.name)
+        raw = getattr(instance, LAZY_DATA)
+        try:
+            data = raw[self.name]
+        except KeyError:  # already parsed by another thread
+            return instance.__dict__[self.name]
+        value = instance.__dict__.setdefault(self.name, self.parser(data))
+        raw.pop(self.name, None)
+        return value
+
+
+def restore_instance(cls: Type, state: Dict[str, Any]):
+    obj = object.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def make_lazy_class(cls: Type, parsers: Dict[str, Parser]) -> Type:
+    """
+    Creates subclass of dataclass `cls` which parses fields from `parsers` on first access.
+    Instances are equal to instances of `cls` and are pickled as them
+    """
+    if is_generic_concrete(cls):
+        cls = cls.__origin__
+    names = tuple(parsers)
+
+    def materialize(self) -> Dict[str, Any]:
+        for name in names:
+            getattr(self, name)
+        return dict(self.__dict__)
+
+    def __reduce__(self):
+        return restore_instance, (cls, materialize(self))
+
+    namespace: Dict[str, Any] = {
+        name: LazyField(name, parser, cls)
+        for name, parser in parsers.items()
+    }
+    namespace.update({
+        "__slots__": (LAZY_DATA,),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__reduce__": __reduce__,
+        LAZY_ORIGIN: cls,
+    })
+    params = getattr(cls, "__dataclass_params__", None)
+    if params is not None and params.eq:
+        field_names = tuple(f.name for f in fields(cls) if f.compare)
+
+        def __eq__(self, other):
+            if other.__class__ is self.__class__ or other.__class__ is cls:
+                return all(getattr(self, x) == getattr(other, x) for x in field_names)
+            return NotImplemented
+
+        namespace["__eq__"] = __eq__
+        namespace["__hash__"] = cls.__hash__
+    return type(cls.__name__, (cls,), namespace)
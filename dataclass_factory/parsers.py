@@ -1,6 +1,6 @@
 import collections.abc
 from collections import deque
-from dataclasses import is_dataclass
+from sys import intern
 from typing import (
     Any, Callable, Collection, Deque, Dict, FrozenSet,
     List, Optional, Sequence, Set, Tuple, Type, Union, Iterable,
@@ -8,24 +8,31 @@ from typing import (
 )
 
 from .common import AbstractFactory, Parser, T
+from .constructors import (
+    can_bypass_dataclass_init, Constructor, get_dataclass_constructor,
+    get_namedtuple_constructor,
+)
 from .exceptions import InvalidFieldError, UnionParseError, UnknownFieldsError
 from .fields import (
     FieldInfo, get_class_fields, get_dataclass_fields,
     get_typeddict_fields, get_namedtuple_fields,
 )
 from .generics import fix_generic_alias
+from .lazy import is_lazy_type, make_lazy_class, supports_lazy
 from .path_utils import CleanKey, CleanPath
-from .schema import RuleForUnknown, Schema, Unknown
+from .schema import InputAliases, InternStrings, RuleForUnknown, Schema, Unknown
 from .type_detection import (
-    args_unspecified, hasargs, is_any, is_iterable, is_dict,
-    is_enum, is_generic_concrete, is_literal, is_literal36, is_newtype,
-    is_none, is_optional, is_tuple, is_typeddict, is_union, is_namedtuple,
-    is_generic,
+    args_unspecified, classify, hasargs, is_generic_concrete, is_literal,
+    is_newtype, is_none, is_union, PRIMITIVE_TYPES, TypeKind,
 )
 from .validators import combine_parser_validators
 
 PARSER_EXCEPTIONS = (ValueError, TypeError, AttributeError, LookupError)
 MISSED = object()  # field is missed in parsed data
+# dicts having less keys than `1 / SPARSE_DATA_RATIO` of fields are parsed key by key instead of field by field.
+# It is done only for classes with many fields, otherwise checking all fields is fast enough
+SPARSE_DATA_RATIO = 4
+SPARSE_MIN_FIELDS = 16
 
 
 def get_element_parser(parser: Parser[T], key: Any) -> Parser[T]:
@@ -36,7 +43,7 @@ def get_element_parser(parser: Parser[T], key: Any) -> Parser[T]:
             e._append_path(str(key))
             raise
         except PARSER_EXCEPTIONS as e:
-            raise InvalidFieldError(str(e), [str(key)])
+            raise InvalidFieldError(e, [str(key)])
 
     return element_parser
 
@@ -48,7 +55,7 @@ def dyn_element_parser(parser: Parser[T], data: Any, key: Any) -> T:
         e._append_path(str(key))
         raise
     except PARSER_EXCEPTIONS as e:
-        raise InvalidFieldError(str(e), [str(key)])
+        raise InvalidFieldError(e, [str(key)])
 
 
 def parse_stub(data: T) -> T:
@@ -60,20 +67,96 @@ def parse_none(data: Any) -> None:
         raise ValueError("None expected")
 
 
+NOT_STR_MESSAGE = "data type is not %s" % str
+
+
+def parse_interned_str(data: Any) -> str:
+    if type(data) is str:
+        return intern(data)
+    if isinstance(data, str):
+        return data
+    raise ValueError(NOT_STR_MESSAGE)
+
+
+def get_interning_parser(parser: Parser[T]) -> Parser[T]:
+    def interning_parser(data):
+        result = parser(data)
+        if type(result) is str:
+            return intern(result)  # type: ignore
+        return result
+
+    return interning_parser
+
+
+def may_be_str(type_: Any) -> bool:
+    if type_ is str:
+        return True
+    if is_newtype(type_):
+        return may_be_str(type_.__supertype__)
+    if is_union(type_):
+        return any(may_be_str(x) for x in type_.__args__)
+    return False
+
+
 def get_parser_with_check(cls: Type[T]) -> Parser[T]:
+    message = "data type is not %s" % cls  # formatted once, not on each error
+
     def parser(data):
         if isinstance(data, cls):
             return data
-        raise ValueError("data type is not %s" % cls)
+        raise ValueError(message)
 
     return parser
 
 
+# these parsers return data unchanged if it is valid
+PARSERS_WITH_CHECK = {
+    cls: get_parser_with_check(cls)
+    for cls in (str, bytearray, bytes)
+}
+
+
+def get_strict_parser(cls: Type[T], coercible: Tuple[Type, ...] = ()) -> Parser[T]:
+    message = "data type is not %s" % cls
+
+    def strict_parser(data):
+        if type(data) is cls:
+            return data
+        if type(data) in coercible:
+            return cls(data)
+        raise ValueError(message)
+
+    return strict_parser
+
+
+# exact types are required, only lossless conversions are allowed
+STRICT_PARSERS = {
+    int: get_strict_parser(int),
+    float: get_strict_parser(float, (int,)),
+    complex: get_strict_parser(complex, (int, float)),
+    bool: get_strict_parser(bool),
+}
+
+
+def get_copy_parser(collection_factory: Callable, zero_copy: bool) -> Parser:
+    if zero_copy:
+        def copy_parser(data):
+            if type(data) is collection_factory:
+                return data
+            return collection_factory(data)
+
+        return copy_parser
+    return collection_factory
+
+
 def get_collection_parser(
     collection_factory: Callable,
     item_parser: Parser[T],
     debug_path: bool,
+    zero_copy: bool = False,
 ) -> Parser[Collection[T]]:
+    if item_parser is parse_stub:
+        return get_copy_parser(collection_factory, zero_copy)
     if debug_path:
         def collection_parser(data):
             return collection_factory(
@@ -87,6 +170,61 @@ def get_collection_parser(
     return collection_parser
 
 
+def get_batch_validator(
+    factory,
+    item_type: Any,
+    fields: Optional[Collection[Optional[str]]] = None,
+) -> Optional[Callable[[Collection], None]]:
+    """
+    Returns function which calls batch validators of `item_type` once with values of their fields from all items.
+    None is returned if there are no such validators
+
+    :param fields: use only validators of these fields (None stands for validators of whole items)
+    """
+    item_kind = classify(fix_generic_alias(item_type))
+    if item_kind not in (TypeKind.DATACLASS, TypeKind.NAMEDTUPLE, TypeKind.TYPEDDICT):
+        return None
+    batch_validators = factory.schema(item_type).batch_validators
+    if not batch_validators:
+        return None
+    validators = [
+        (field, field_validators)
+        for field, field_validators in batch_validators.items()
+        if fields is None or field in fields
+    ]
+    if not validators:
+        return None
+    by_key = item_kind is TypeKind.TYPEDDICT
+
+    def batch_validator(items):
+        for field, field_validators in validators:
+            if field is None:
+                values = list(items)
+            elif by_key:
+                values = [x[field] for x in items if field in x]
+            else:
+                values = [getattr(x, field) for x in items]
+            for validator in field_validators:
+                validator(values)
+
+    return batch_validator
+
+
+def get_batch_validating_parser(
+    parser: Parser[Collection[T]],
+    batch_validator: Optional[Callable[[Collection[T]], None]],
+) -> Parser[Collection[T]]:
+    if batch_validator is None:
+        return parser
+
+    def batch_validating_parser(data):
+        result = parser(data)
+        batch_validator(result)
+        return result
+
+    return batch_validating_parser
+
+
 def get_union_parser(parsers: Collection[Callable]) -> Parser:
     def union_parser(data):
         errors = []
@@ -96,7 +234,7 @@ def get_union_parser(parsers: Collection[Callable]) -> Parser:
             except PARSER_EXCEPTIONS as e:
                 errors.append((p.__qualname__, e))
                 continue
-        raise UnionParseError("No suitable parsers in union found for `%s`" % data, errors)
+        raise UnionParseError("No suitable parsers in union found for `%s`", errors, data)
 
     return union_parser
 
@@ -147,6 +285,30 @@ def get_field_parser(
         return item, parser
 
 
+# key of parsed data -> fields read from it: field name, parser and priority of the key for that field.
+# Priority is None for fields without aliases, otherwise 0 means own name of field, 1 - first alias, etc.
+KeyTable = Dict[CleanKey, List[Tuple[str, Parser, Optional[int]]]]
+
+
+def get_key_table(
+    field_info: Sequence[Tuple[str, CleanKey, Parser]],
+    alias_info: Sequence[Tuple[str, CleanKey, Parser]],
+) -> KeyTable:
+    aliased = {field_name for field_name, _, _ in alias_info}
+    priorities: Dict[str, int] = {}
+    table: KeyTable = {}
+    for field_name, item_name, parser in field_info:
+        priority = 0 if field_name in aliased else None
+        priorities[field_name] = 0
+        table.setdefault(item_name, []).append((field_name, parser, priority))
+    for field_name, item_name, parser in alias_info:
+        if item_name in table:
+            raise ValueError(f"Alias `{item_name}` of field `{field_name}` is already used")
+        priorities[field_name] += 1
+        table[item_name] = [(field_name, parser, priorities[field_name])]
+    return table
+
+
 def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
                        factory: AbstractFactory,
                        fields: Sequence[FieldInfo],
@@ -154,37 +316,86 @@ def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
                        unknown: RuleForUnknown,
                        pre_validators: Dict[Optional[str], List[Parser]],
                        post_validators: Dict[Optional[str], List[Parser]],
+                       constructor: Optional[Constructor[T]] = None,
+                       intern_strings: InternStrings = None,
+                       raw_fields: Collection[str] = (),
+                       field_parsers: Optional[Dict[str, Parser]] = None,
+                       aliases: InputAliases = None,
                        ) -> Parser[T]:
+    """
+    :param constructor: function creating instance from dict of parsed fields.
+                        `class_` is called with fields as keyword arguments if it is not provided
+    :param intern_strings: intern parsed strings of all fields (if True) or only listed ones
+    :param raw_fields: fields which are passed to constructor without parsing
+    :param field_parsers: parsers used for some fields instead of ones created by factory for their types
+    :param aliases: additional keys of data for fields. Field value is read from the key directly, not using its path
+    """
+    def type_parser(field: FieldInfo) -> Parser:
+        if field_parsers and field.field_name in field_parsers:
+            parser = field_parsers[field.field_name]
+        else:
+            parser = factory.parser(field.type)
+        if intern_strings is True:
+            need_intern = may_be_str(field.type)
+        else:
+            need_intern = bool(intern_strings) and field.field_name in intern_strings  # type: ignore
+        if need_intern and parser is not parse_interned_str:
+            return get_interning_parser(parser)
+        return parser
+
     field_info = tuple(
         (
             f.field_name,
             *get_field_parser(
                 item=f.data_name,
-                parser=factory.parser(f.type),
+                parser=type_parser(f),
                 pre_validators=pre_validators.get(f.field_name, []) + pre_validators.get(None, []),
                 post_validators=post_validators.get(f.field_name, []) + post_validators.get(None, []),
             ),
         )
+        if f.field_name not in raw_fields else (f.field_name, f.data_name, parse_stub)
+        for f in fields
+    )
+    alias_info = tuple(
+        (
+            f.field_name,
+            alias,
+            combine_parser_validators(
+                pre_validators.get(f.field_name, []) + pre_validators.get(None, []),
+                type_parser(f),
+                post_validators.get(f.field_name, []) + post_validators.get(None, []),
+            ) if f.field_name not in raw_fields else parse_stub,
+        )
         for f in fields
+        for alias in (aliases or {}).get(f.field_name, ())
     )
     list_mode = any(isinstance(name, int) for _, name, _ in field_info)
 
     if debug_path:
-        field_info = tuple(
-            (field_name, data_name, get_element_parser(parser, field_name))
-            for field_name, data_name, parser in field_info
+        field_info, alias_info = (
+            tuple(
+                (field_name, data_name, get_element_parser(parser, field_name))
+                if field_name not in raw_fields else (field_name, data_name, parser)
+                for field_name, data_name, parser in info
+            )
+            for info in (field_info, alias_info)
         )
     if list_mode:
         if unknown != Unknown.SKIP:
             raise ValueError("Cannot use unknown=`%s` when parsing list", unknown)
+        if alias_info:
+            raise ValueError("Cannot use aliases when parsing list")
 
         def complex_parser(data):
             count = len(data)
-            return class_(**{
+            fields = {
                 field_name: parser(data[item_idx])
                 for field_name, item_idx, parser in field_info
                 if item_idx < count
-            })
+            }
+            if constructor is not None:
+                return constructor(fields)
+            return class_(**fields)
     else:
         forbid_unknown = False
         store_unknown_separate = False
@@ -192,6 +403,8 @@ def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
         if unknown is Unknown.FORBID:
             forbid_unknown = True
         elif unknown is Unknown.STORE:
+            if constructor is not None:
+                raise ValueError("Cannot use unknown=`%s` with custom constructor" % unknown)
             store_unknown = True
         elif unknown is Unknown.SKIP:
             pass
@@ -201,36 +414,108 @@ def get_complex_parser(class_: Type[T],  # noqa C901, CCR001
         else:  # sequence of string
             store_unknown_separate = True
 
-        known_fields = {f.data_name for f in fields}
+        # only the first key of a flattened field's path is checked in data
+        known_fields = {item_name for _, item_name, _ in field_info + alias_info}
+        if len(field_info) >= SPARSE_MIN_FIELDS:
+            sparse_limit = len(field_info) // SPARSE_DATA_RATIO
+        else:
+            sparse_limit = 0
+        # data is always parsed key by key if unknown fields are stored, so they are found in the same pass.
+        # With aliases it is needed to use only one of field names
+        by_keys = bool(alias_info) or store_unknown or store_unknown_separate
+        key_table = get_key_table(field_info, alias_info) if by_keys or sparse_limit else None
+        unknown_entries: List[Tuple[str, Parser, Optional[int]]] = []
+        if store_unknown_separate:
+            # these fields get unknown fields instead of their own values
+            for name in unknown:
+                entries = key_table.pop(name, None)  # type: ignore
+                if entries is not None:
+                    unknown_entries.extend(entries)
+                    key_table[name] = []  # type: ignore
 
         def complex_parser(data):
             if forbid_unknown and not known_fields.issuperset(data):
                 unknown_field_names = set(data) - known_fields
                 raise UnknownFieldsError(f"Cannot parse {class_}", unknown_field_names)
-            elif store_unknown_separate:
-                extras = {k: v for k, v in data.items() if k not in known_fields}
-                for field in unknown:
-                    data[field] = extras
-                unknown_fields = {}
-            elif store_unknown:
-                unknown_fields = {k: v for k, v in data.items() if k not in known_fields}
-            else:
-                unknown_fields = {}
 
             fields = {}
-            for field_name, item_name, parser in field_info:
-                if item_name in data:
-                    result = parser(data[item_name])
+            if key_table is not None and (by_keys or (type(data) is dict and len(data) < sparse_limit)):
+                # each key is checked once, if several names of a field are found the first listed one is used.
+                # Values of aliased fields are parsed after all keys are checked, so only the selected one is parsed
+                selected: Dict[str, Tuple[int, Parser, Any]] = {}
+                extras = {}
+                for key, value in data.items():
+                    entries = key_table.get(key)
+                    if entries is None:
+                        extras[key] = value
+                        continue
+                    for field_name, parser, priority in entries:
+                        if priority is not None:
+                            if field_name not in selected or selected[field_name][0] > priority:
+                                selected[field_name] = (priority, parser, value)
+                            continue
+                        result = parser(value)
+                        if result is not MISSED:
+                            fields[field_name] = result
+                for field_name, (_, parser, value) in selected.items():
+                    result = parser(value)
                     if result is not MISSED:
                         fields[field_name] = result
-            return class_(
-                **fields,
-                **unknown_fields,
-            )
+                for field_name, parser, _ in unknown_entries:
+                    result = parser(extras)
+                    if result is not MISSED:
+                        fields[field_name] = result
+                if store_unknown:
+                    return class_(**fields, **extras)
+            else:
+                for field_name, item_name, parser in field_info:
+                    if item_name in data:
+                        result = parser(data[item_name])
+                        if result is not MISSED:
+                            fields[field_name] = result
+            if constructor is not None:
+                return constructor(fields)
+            return class_(**fields)
 
     return complex_parser
 
 
+def get_lazy_dataclass_parser(
+    class_: Type[T],
+    factory: AbstractFactory,
+    fields: Sequence[FieldInfo],
+    debug_path: bool,
+    unknown: RuleForUnknown,
+    pre_validators: Dict[Optional[str], List[Parser]],
+    post_validators: Dict[Optional[str], List[Parser]],
+    intern_strings: InternStrings = None,
+    aliases: InputAliases = None,
+) -> Parser[T]:
+    lazy_parsers = {
+        f.field_name: combine_parser_validators(
+            pre_validators.get(f.field_name, []) + pre_validators.get(None, []),
+            factory.parser(f.type),
+            post_validators.get(f.field_name, []) + post_validators.get(None, []),
+        )
+        for f in fields
+        if is_lazy_type(f.type) and not isinstance(f.data_name, tuple)
+    }
+    lazy_class = make_lazy_class(class_, lazy_parsers)
+    return get_complex_parser(
+        class_=class_,
+        factory=factory,
+        fields=fields,
+        debug_path=debug_path,
+        unknown=unknown,
+        pre_validators=pre_validators,
+        post_validators=post_validators,
+        constructor=get_dataclass_constructor(class_, lazy_class, tuple(lazy_parsers)),
+        intern_strings=intern_strings,
+        raw_fields=frozenset(lazy_parsers),
+        aliases=aliases,
+    )
+
+
 def get_typed_dict_parser(
     class_: Type,
     factory: AbstractFactory,
@@ -239,10 +524,17 @@ def get_typed_dict_parser(
     unknown: Union[str, RuleForUnknown],
     pre_validators: Dict[Optional[str], List[Parser]],
     post_validators: Dict[Optional[str], List[Parser]],
+    intern_strings: InternStrings = None,
+    trusted: bool = False,
+    aliases: InputAliases = None,
 ) -> Parser:
-    complex_parser = get_complex_parser(class_, factory, fields, debug_path, unknown, pre_validators, post_validators)
+    complex_parser = get_complex_parser(
+        class_, factory, fields, debug_path, unknown, pre_validators, post_validators,
+        intern_strings=intern_strings,
+        aliases=aliases,
+    )
     requires_fields = {f.field_name for f in fields}
-    if class_.__total__:
+    if class_.__total__ and not trusted:
         def total_parser(data):
             res = complex_parser(data)
 
@@ -256,6 +548,9 @@ def get_typed_dict_parser(
 
 
 def get_optional_parser(parser: Parser[T]) -> Parser[Optional[T]]:
+    if parser is parse_stub:
+        return parse_stub
+
     def optional_parser(data):
         return parser(data) if data is not None else None
 
@@ -295,8 +590,26 @@ def get_collection_factory(cls) -> Type:
     return res
 
 
-def get_dict_parser(key_parser, value_parser) -> Parser:
-    return lambda data: {key_parser(k): value_parser(v) for k, v in data.items()}
+def get_dict_parser(key_parser, value_parser, zero_copy: bool = False) -> Parser:
+    if value_parser is not parse_stub:
+        return lambda data: {key_parser(k): value_parser(v) for k, v in data.items()}
+    if key_parser is parse_stub:
+        check_keys = None
+    elif key_parser in PARSERS_WITH_CHECK.values():
+        check_keys = key_parser
+    else:
+        return lambda data: {key_parser(k): v for k, v in data.items()}
+
+    def dict_copy_parser(data):
+        keys = data.keys()  # data must be a mapping
+        if check_keys:
+            for key in keys:
+                check_keys(key)
+        if zero_copy and type(data) is dict:
+            return data
+        return dict(data)
+
+    return dict_copy_parser
 
 
 def get_literal_parser(factory, values: Sequence[Any]) -> Parser:
@@ -309,6 +622,18 @@ def get_literal_parser(factory, values: Sequence[Any]) -> Parser:
     return literal_parser
 
 
+def get_reparsing_parser(parser: Parser[T], get_debug_parser: Callable[[], Parser[T]]) -> Parser[T]:
+    def reparsing_parser(data):
+        try:
+            return parser(data)
+        except PARSER_EXCEPTIONS:
+            pass
+        # parse again to find path to invalid field
+        return get_debug_parser()(data)
+
+    return reparsing_parser
+
+
 def get_lazy_parser(factory, class_: Type) -> Parser:
     def lazy_parser(data):
         return factory.load(data, class_)
@@ -316,10 +641,18 @@ def get_lazy_parser(factory, class_: Type) -> Parser:
     return lazy_parser
 
 
-def create_parser(factory, schema: Schema, debug_path: bool, cls: Type) -> Parser:
-    parser = create_parser_impl(factory, schema, debug_path, cls)
-    pre = schema.pre_parse
-    post = schema.post_parse
+def create_parser(factory, schema: Schema, debug_path: bool, cls: Type, trusted: bool = False) -> Parser:
+    """
+    :param trusted: data is expected to be well-typed, so primitive values are not checked or converted
+    """
+    if trusted:
+        parser = create_trusted_parser_impl(factory, schema, debug_path, cls)
+    else:
+        parser = create_parser_impl(factory, schema, debug_path, cls)
+    return get_parser_with_steps(parser, schema.pre_parse, schema.post_parse)
+
+
+def get_parser_with_steps(parser: Parser[T], pre: Optional[Callable], post: Optional[Callable]) -> Parser[T]:
     if pre or post:
         def parser_with_steps(data):
             if pre:
@@ -333,27 +666,83 @@ def create_parser(factory, schema: Schema, debug_path: bool, cls: Type) -> Parse
     return parser
 
 
+def get_trusted_union_parser(factory, types: Sequence[Any]) -> Parser:
+    if len(types) == 1:
+        return factory.parser(types[0])
+    # primitives, literals and items of collections are parsed as is in trusted mode,
+    # so members except the last one are parsed with checks to select the right one
+    last = len(types) - 1
+    return get_union_parser(tuple(
+        get_parser_with_check(x) if x in PRIMITIVE_TYPES else
+        factory.parser(x) if i == last else
+        factory.checked_parser(x)
+        for i, x in enumerate(types)
+    ))
+
+
+def create_trusted_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) -> Parser:
+    """
+    Creates parser for data of expected types. Only structural conversion is done:
+    primitive values, `None` and literals are returned as is, TypedDict totality is not checked
+    """
+    cls = fix_generic_alias(cls)
+    kind = classify(cls)
+    if kind is TypeKind.NEWTYPE:
+        return create_trusted_parser_impl(factory, schema, debug_path, cls.__supertype__)
+    if cls is str and schema.intern_strings is True:
+        return parse_interned_str
+    if kind in (TypeKind.PRIMITIVE, TypeKind.NONE, TypeKind.LITERAL):
+        return parse_stub
+    if kind is TypeKind.TYPEDDICT:
+        return get_typed_dict_parser(
+            cls,
+            factory,
+            get_typeddict_fields(schema, cls),
+            debug_path,
+            unknown=schema.unknown,
+            pre_validators=schema.pre_validators,
+            post_validators=schema.post_validators,
+            intern_strings=schema.intern_strings,
+            aliases=schema.aliases,
+            trusted=True,
+        )
+    if kind is TypeKind.UNION:
+        types = [x for x in cls.__args__ if not is_none(x)]
+        if not types:
+            return parse_stub
+        parser = get_trusted_union_parser(factory, types)
+        if len(types) < len(cls.__args__):
+            return get_optional_parser(parser)
+        return parser
+    return create_parser_impl(factory, schema, debug_path, cls)
+
+
 def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) -> Parser:  # noqa C901, CCR001
     cls = fix_generic_alias(cls)
-    if is_any(cls):
+    kind = classify(cls)
+    if kind is TypeKind.ANY:
         return parse_stub
-    if is_none(cls):
+    if kind is TypeKind.NONE:
         return parse_none
-    if is_literal(cls):
-        return get_literal_parser(factory, cls.__args__)
-    if is_literal36(cls):
+    if kind is TypeKind.LITERAL:
+        if is_literal(cls):
+            return get_literal_parser(factory, cls.__args__)
         return get_literal_parser(factory, cls.__values__)
-    if is_optional(cls):
+    if kind is TypeKind.OPTIONAL:
         return get_optional_parser(factory.parser(cls.__args__[0]))
-    if cls in (str, bytearray, bytes):
-        return get_parser_with_check(cls)
-    if cls in (int, float, complex, bool):
+    if kind is TypeKind.PRIMITIVE:
+        if cls is str and schema.intern_strings is True:
+            return parse_interned_str
+        if cls in (str, bytearray, bytes):
+            return PARSERS_WITH_CHECK[cls]
+        if schema.strict:
+            return STRICT_PARSERS[cls]
         return cls
-    if is_newtype(cls):
+    if kind is TypeKind.NEWTYPE:
         return create_parser_impl(factory, schema, debug_path, cls.__supertype__)
-    if is_enum(cls):
+    if kind is TypeKind.ENUM:
         return cls
-    if is_namedtuple(cls):
+    if kind is TypeKind.NAMEDTUPLE:
         return get_complex_parser(
             class_=cls,
             factory=factory,
@@ -362,24 +751,33 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
             unknown=schema.unknown,
             pre_validators=schema.pre_validators,
             post_validators=schema.post_validators,
+            constructor=get_namedtuple_constructor(cls) if schema.bypass_init else None,
+            intern_strings=schema.intern_strings,
+            aliases=schema.aliases,
         )
-    if is_tuple(cls):
+    if kind is TypeKind.TUPLE:
         if not hasargs(cls):
             return tuple_any_parser
         elif len(cls.__args__) == 2 and cls.__args__[1] is Ellipsis:
             item_parser = factory.parser(cls.__args__[0])
-            return get_collection_parser(tuple, item_parser, debug_path)
+            return get_batch_validating_parser(
+                get_collection_parser(tuple, item_parser, debug_path, bool(schema.zero_copy)),
+                get_batch_validator(factory, cls.__args__[0]),
+            )
         else:
             return get_tuple_parser(tuple(factory.parser(x) for x in cls.__args__), debug_path)
-    if is_dict(cls):
+    if kind is TypeKind.DICT:
         if args_unspecified(cls):
             key_type_arg = Any
             value_type_arg = Any
         else:
             key_type_arg = cls.__args__[0]
             value_type_arg = cls.__args__[1]
-        return get_dict_parser(factory.parser(key_type_arg), factory.parser(value_type_arg))
-    if is_typeddict(cls) or (is_generic_concrete(cls) and is_typeddict(cls.__origin__)):
+        key_parser = factory.parser(key_type_arg)
+        if schema.intern_strings is True and may_be_str(key_type_arg):
+            key_parser = get_interning_parser(key_parser)
+        return get_dict_parser(key_parser, factory.parser(value_type_arg), bool(schema.zero_copy))
+    if kind is TypeKind.TYPEDDICT:
         return get_typed_dict_parser(
             cls,
             factory,
@@ -388,8 +786,26 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
             unknown=schema.unknown,
             pre_validators=schema.pre_validators,
             post_validators=schema.post_validators,
+            intern_strings=schema.intern_strings,
+            aliases=schema.aliases,
         )
-    if is_dataclass(cls) or (is_generic_concrete(cls) and is_dataclass(cls.__origin__)):
+    if kind is TypeKind.DATACLASS:
+        if schema.lazy and not schema.bypass_init:
+            # lazy instances are filled directly, so logic of custom `__init__` would be lost silently
+            raise ValueError("Cannot use `lazy` parsing without `bypass_init` for `%s`" % cls)
+        use_bypass = schema.bypass_init and can_bypass_dataclass_init(cls)
+        if schema.lazy and use_bypass and supports_lazy(cls):
+            return get_lazy_dataclass_parser(
+                class_=cls,
+                factory=factory,
+                fields=get_dataclass_fields(schema, cls),
+                debug_path=debug_path,
+                unknown=schema.unknown,
+                pre_validators=schema.pre_validators,
+                post_validators=schema.post_validators,
+                intern_strings=schema.intern_strings,
+                aliases=schema.aliases,
+            )
         return get_complex_parser(
             class_=cls,
             factory=factory,
@@ -398,16 +814,22 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
             unknown=schema.unknown,
             pre_validators=schema.pre_validators,
             post_validators=schema.post_validators,
+            constructor=get_dataclass_constructor(cls) if use_bypass else None,
+            intern_strings=schema.intern_strings,
+            aliases=schema.aliases,
         )
-    if is_iterable(cls):
+    if kind is TypeKind.ITERABLE:
         if args_unspecified(cls):
             value_type_arg = Any
         else:
             value_type_arg = cls.__args__[0]
         collection_factory = get_collection_factory(cls)
         item_parser = factory.parser(value_type_arg)
-        return get_collection_parser(collection_factory, item_parser, debug_path)
-    if is_union(cls):
+        return get_batch_validating_parser(
+            get_collection_parser(collection_factory, item_parser, debug_path, bool(schema.zero_copy)),
+            get_batch_validator(factory, value_type_arg),
+        )
+    if kind is TypeKind.UNION:
         # also, check if Union can be converted to Optional[...] or Optional[Union[...]]
         parsers = tuple(factory.parser(x) for x in cls.__args__ if not is_none(x))
         if len(parsers) == 0:
@@ -428,6 +850,8 @@ def create_parser_impl(factory, schema: Schema, debug_path: bool, cls: Type) ->
             unknown=schema.unknown,
             pre_validators=schema.pre_validators,
             post_validators=schema.post_validators,
+            intern_strings=schema.intern_strings,
+            aliases=schema.aliases,
         )
     except PARSER_EXCEPTIONS:
         raise ValueError("Cannot find parser for `%s`" % repr(cls))
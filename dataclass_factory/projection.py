@@ -0,0 +1,159 @@
+from dataclasses import MISSING
+from typing import Any, Callable, Collection, Dict, Optional, Sequence, Type
+
+from .common import Parser, T
+from .constructors import can_bypass_dataclass_init, get_dataclass_constructor, get_namedtuple_constructor
+from .fields import FieldInfo, get_dataclass_fields, get_namedtuple_fields
+from .generics import fix_generic_alias
+from .parsers import (
+    get_batch_validating_parser, get_batch_validator, get_collection_factory, get_collection_parser,
+    get_complex_parser, get_dict_parser, get_optional_parser, get_parser_with_steps,
+)
+from .schema import Unknown
+from .type_detection import args_unspecified, classify, hasargs, is_none, TypeKind
+
+# field name -> projection of its value. None means that field is parsed completely
+Projection = Dict[str, Optional["Projection"]]  # type: ignore
+
+
+class Skipped:
+    def __repr__(self):
+        return "SKIPPED"
+
+
+# value of required fields which were not requested in projection
+SKIPPED: Any = Skipped()
+
+
+def make_projection(include: Collection[str]) -> Projection:
+    """
+    Converts set of paths like `customer.name` or `lines[].sku` into a tree of field names.
+    `[]` means items of collection and can be omitted
+    """
+    projection: Projection = {}
+    for path in sorted(include, key=len):
+        current = projection
+        names = [name.replace("[]", "") for name in path.split(".")]
+        for i, name in enumerate(names):
+            if not name:
+                raise ValueError(f"Invalid field path `{path}`")
+            if name in current and current[name] is None:
+                break  # whole field is already requested
+            if i == len(names) - 1:
+                current[name] = None
+            else:
+                current = current.setdefault(name, {})  # type: ignore
+    return projection
+
+
+def get_skipping_constructor(
+    class_: Type[T],
+    constructor: Optional[Callable[[Dict[str, Any]], T]],
+    skipped: Dict[str, Any],
+) -> Callable[[Dict[str, Any]], T]:
+    if constructor is not None:
+        def skipping_constructor(values):
+            return constructor({**skipped, **values})
+    else:
+        def skipping_constructor(values):
+            return class_(**skipped, **values)
+    return skipping_constructor
+
+
+class ProjectionBuilder:
+    """
+    Creates parsers which process only requested subset of fields
+    """
+
+    def __init__(self, factory, debug_path: bool):
+        self.factory = factory
+        self.debug_path = debug_path
+
+    def parser(self, class_: Type, projection: Optional[Projection]) -> Parser:
+        if projection is None:
+            return self.factory.parser(class_)
+        schema = self.factory.schema(class_)
+        if schema.parser or schema.get_parser:
+            return self.factory.parser(class_)
+        parser = self.create_parser_impl(schema, class_, projection)
+        return get_parser_with_steps(parser, schema.pre_parse, schema.post_parse)
+
+    def create_parser_impl(self, schema, class_: Type, projection: Projection) -> Parser:  # noqa C901,CCR001
+        cls = fix_generic_alias(class_)
+        kind = classify(cls)
+        if kind is TypeKind.NAMEDTUPLE:
+            constructor = get_namedtuple_constructor(cls) if schema.bypass_init else None
+            return self.get_complex_parser(schema, cls, get_namedtuple_fields(schema, cls), projection, constructor)
+        if kind is TypeKind.DATACLASS:
+            if schema.bypass_init and can_bypass_dataclass_init(cls):
+                constructor = get_dataclass_constructor(cls)
+            else:
+                constructor = None
+            return self.get_complex_parser(schema, cls, get_dataclass_fields(schema, cls), projection, constructor)
+        if kind is TypeKind.UNION:
+            args = [x for x in cls.__args__ if not is_none(x)]
+            if len(args) == 1 and len(cls.__args__) == 2:
+                return get_optional_parser(self.parser(args[0], projection))
+        elif kind is TypeKind.TUPLE:
+            if hasargs(cls) and len(cls.__args__) == 2 and cls.__args__[1] is Ellipsis:
+                item_parser = self.parser(cls.__args__[0], projection)
+                return get_batch_validating_parser(
+                    get_collection_parser(tuple, item_parser, self.debug_path),
+                    self.get_batch_validator(cls.__args__[0], projection),
+                )
+        elif kind is TypeKind.DICT:
+            if not args_unspecified(cls):
+                return get_dict_parser(
+                    self.factory.parser(cls.__args__[0]),
+                    self.parser(cls.__args__[1], projection),
+                )
+        elif kind is TypeKind.ITERABLE and not args_unspecified(cls):
+            item_parser = self.parser(cls.__args__[0], projection)
+            return get_batch_validating_parser(
+                get_collection_parser(get_collection_factory(cls), item_parser, self.debug_path),
+                self.get_batch_validator(cls.__args__[0], projection),
+            )
+        raise ValueError(f"Cannot select fields of `{class_}`")
+
+    def get_batch_validator(self, item_type: Type, projection: Projection) -> Optional[Callable]:
+        # other fields are skipped or parsed partially, so their values cannot be checked
+        parsed_fields = [name for name, field_projection in projection.items() if field_projection is None]
+        return get_batch_validator(self.factory, item_type, parsed_fields)
+
+    def get_complex_parser(
+        self,
+        schema,
+        class_: Type,
+        fields: Sequence[FieldInfo],
+        projection: Projection,
+        constructor: Optional[Callable],
+    ) -> Parser:
+        known_fields = {f.field_name for f in fields}
+        unknown_fields = set(projection) - known_fields
+        if unknown_fields:
+            raise ValueError(f"Fields {unknown_fields} are not found in `{class_}`")
+        skipped = {
+            f.field_name: SKIPPED
+            for f in fields
+            if f.field_name not in projection and f.default is MISSING
+        }
+        builder = self
+        if schema.strict is not None:
+            builder = ProjectionBuilder(self.factory._strict_variant(bool(schema.strict)), self.debug_path)
+        return get_complex_parser(
+            class_=class_,
+            factory=builder.factory,
+            fields=[f for f in fields if f.field_name in projection],
+            debug_path=self.debug_path,
+            unknown=Unknown.SKIP,
+            pre_validators=schema.pre_validators,
+            post_validators=schema.post_validators,
+            constructor=get_skipping_constructor(class_, constructor, skipped) if skipped else constructor,
+            intern_strings=schema.intern_strings,
+            aliases=schema.aliases,
+            field_parsers={
+                f.field_name: builder.parser(f.type, projection[f.field_name])
+                for f in fields
+                if f.field_name in projection
+            },
+        )
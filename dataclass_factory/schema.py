@@ -17,6 +17,9 @@ class Unknown(Enum):
 
 
 RuleForUnknown = Union[Unknown, str, Sequence[str], None]
+InternStrings = Union[bool, Sequence[str], None]
+# field name -> additional names of keys in parsed data
+InputAliases = Optional[Dict[str, Sequence[str]]]
 
 
 class Schema(Generic[T]):
@@ -29,6 +32,7 @@ class Schema(Generic[T]):
     """
     pre_validators: Dict[Optional[str], List[Parser]]
     post_validators: Dict[Optional[str], List[Parser]]
+    batch_validators: Dict[Optional[str], List[Callable]]
 
     def __init__(  # noqa C901,CCR001
         self,
@@ -54,10 +58,18 @@ class Schema(Generic[T]):
 
         omit_default: Optional[bool] = None,
         unknown: RuleForUnknown = None,
+        bypass_init: Optional[bool] = None,
+        intern_strings: InternStrings = None,
+        lazy: Optional[bool] = None,
+        zero_copy: Optional[bool] = None,
+        strict: Optional[bool] = None,
+        aliases: InputAliases = None,
+        omit_none: Optional[bool] = None,
+        omit_empty: Optional[bool] = None,
         name: Optional[str] = None,
         description: Optional[str] = None,
     ):
-        self.pre_validators, self.post_validators = prepare_validators(self)
+        self.pre_validators, self.post_validators, self.batch_validators = prepare_validators(self)
         if only is not None or not hasattr(self, "only"):
             self.only = only
         if exclude is not None or not hasattr(self, "exclude"):
@@ -97,6 +109,22 @@ class Schema(Generic[T]):
             self.omit_default = omit_default
         if unknown is not None or not hasattr(self, "unknown"):
             self.unknown = unknown
+        if bypass_init is not None or not hasattr(self, "bypass_init"):
+            self.bypass_init = bypass_init
+        if intern_strings is not None or not hasattr(self, "intern_strings"):
+            self.intern_strings = intern_strings
+        if lazy is not None or not hasattr(self, "lazy"):
+            self.lazy = lazy
+        if zero_copy is not None or not hasattr(self, "zero_copy"):
+            self.zero_copy = zero_copy
+        if strict is not None or not hasattr(self, "strict"):
+            self.strict = strict
+        if aliases is not None or not hasattr(self, "aliases"):
+            self.aliases = aliases
+        if omit_none is not None or not hasattr(self, "omit_none"):
+            self.omit_none = omit_none
+        if omit_empty is not None or not hasattr(self, "omit_empty"):
+            self.omit_empty = omit_empty
 
         if name is not None or not hasattr(self, "name"):
             self.name = name
@@ -122,10 +150,19 @@ SCHEMA_FIELDS = {
     "post_serialize",
     "omit_default",
     "unknown",
+    "bypass_init",
+    "intern_strings",
+    "lazy",
+    "zero_copy",
+    "strict",
+    "aliases",
+    "omit_none",
+    "omit_empty",
     "name",
     "description",
     "pre_validators",
     "post_validators",
+    "batch_validators",
 }
 
 _SP_OWN_ATTRS = ("_schemas", "_patch")
@@ -166,5 +203,64 @@ class SchemaProxy:
         self._schemas, self._patch = state
 
 
+def flatten_schemas(schemas: Sequence[Optional[Schema]]) -> List[Schema]:
+    # nested proxies are expanded, so attribute lookup does not depend on how many times schemas were merged
+    flat: List[Schema] = []
+    for schema in schemas:
+        if isinstance(schema, SchemaProxy) and not schema._patch:
+            inner = schema._schemas
+        elif isinstance(schema, ResolvedSchema):
+            inner = schema._schemas
+        elif schema:
+            inner = (schema,)
+        else:
+            continue
+        flat.extend(x for x in inner if all(x is not y for y in flat))
+    return flat
+
+
 def merge_schema(*schemas: Optional[Schema]) -> Schema:
-    return cast(Schema, SchemaProxy(*[s for s in schemas if s]))
+    return cast(Schema, SchemaProxy(*flatten_schemas(schemas)))
+
+
+_RS_FIELDS = tuple(sorted(SCHEMA_FIELDS))
+
+
+class ResolvedSchema:
+    """
+    Immutable result of merging schemas.
+    Values of all schema settings are found once and stored as plain attributes.
+    Other attributes (e.g. custom methods of Schema subclasses) are searched in merged schemas
+    """
+    __slots__ = _RS_FIELDS + ("_schemas",)
+
+    def __init__(self, *schemas: Schema):
+        setter = object.__setattr__
+        setter(self, "_schemas", schemas)
+        for item in _RS_FIELDS:
+            value = None
+            for schema in schemas:
+                value = getattr(schema, item, None)
+                if value is not None:
+                    break
+            setter(self, item, value)
+
+    def __getattr__(self, item):
+        for schema in self._schemas:
+            res = getattr(schema, item, None)
+            if res is not None:
+                return res
+        raise AttributeError(f"Field `{item}` is not defined for Schema")
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Resolved schema cannot be modified")
+
+    def __reduce__(self):
+        return ResolvedSchema, self._schemas
+
+
+def resolve_schema(*schemas: Optional[Schema]) -> Schema:
+    """
+    Merges schemas like `merge_schema` but returns immutable object with precalculated settings
+    """
+    return cast(Schema, ResolvedSchema(*flatten_schemas(schemas)))
@@ -1,38 +1,24 @@
-import decimal
+import sys
+from importlib import import_module
 from datetime import datetime, date, time, timedelta
-from fractions import Fraction
-from ipaddress import (
-    IPv4Address, IPv6Address,
-    IPv4Network, IPv6Network,
-    IPv4Interface, IPv6Interface,
-)
-from operator import attrgetter
-from pathlib import Path
-from typing import Type, Dict, Any, Generic, cast, Callable
-from uuid import UUID
+from typing import Type, Dict, Any, Generic, Callable, Iterator, Optional, Set, Tuple
 
 from .common import T, AbstractFactory, Parser
 from .schema import Schema
 
-COMMON_SCHEMAS: Dict[Type, Schema] = {}
 try:
     isodatetime_schema = Schema[datetime](
         parser=datetime.fromisoformat,  # type: ignore
         serializer=datetime.isoformat,
     )
-    COMMON_SCHEMAS[datetime] = isodatetime_schema
-
     isodate_schema = Schema[date](
         parser=date.fromisoformat,
         serializer=date.isoformat
     )
-    COMMON_SCHEMAS[date] = isodate_schema
-
     isotime_schema = Schema[time](
         parser=time.fromisoformat,
         serializer=time.isoformat
     )
-    COMMON_SCHEMAS[time] = isotime_schema
 except AttributeError:
     pass
 
@@ -40,21 +26,195 @@ timedelta_schema = Schema[timedelta](
     parser=lambda x: timedelta(seconds=x),
     serializer=timedelta.total_seconds,
 )
-COMMON_SCHEMAS[timedelta] = timedelta_schema
 
 
-def _parse_decimal(value: Any) -> decimal.Decimal:
+def _get_decimal_schema(type_: Type) -> Schema:
+    # module is found once, so it is not looked up for each parsed value
+    invalid_operation = sys.modules[type_.__module__].InvalidOperation
+
+    def parse_decimal(value: Any) -> Any:
+        try:
+            return type_(value)
+        except invalid_operation as e:
+            raise ValueError from e
+
+    return Schema(
+        parser=parse_decimal,
+        serializer=lambda x: format(x, "f"),
+    )
+
+
+def _get_str_schema(type_: Type) -> Schema:
+    return Schema(
+        serializer=type_.__str__,  # type: ignore
+        parser=type_,
+    )
+
+
+# Schemas created on first use for types from standard library which modules are not imported by default.
+# Type is identified by the module and the name, so the module is not imported until the type is used.
+# Value is a function creating schema for the type
+_COMMON_SCHEMA_GETTERS: Dict[Tuple[str, str], Callable[[Type], Schema]] = {
+    ("decimal", "Decimal"): _get_decimal_schema,
+    ("uuid", "UUID"): _get_str_schema,
+    ("pathlib", "Path"): _get_str_schema,
+    ("fractions", "Fraction"): _get_str_schema,
+    ("ipaddress", "IPv4Address"): _get_str_schema,
+    ("ipaddress", "IPv6Address"): _get_str_schema,
+    ("ipaddress", "IPv4Network"): _get_str_schema,
+    ("ipaddress", "IPv6Network"): _get_str_schema,
+    ("ipaddress", "IPv4Interface"): _get_str_schema,
+    ("ipaddress", "IPv6Interface"): _get_str_schema,
+}
+_COMMON_SCHEMA_NAMES = {name: module for module, name in _COMMON_SCHEMA_GETTERS}
+
+
+def _create_common_schema(class_: Any) -> Optional[Schema]:
+    name = getattr(class_, "__name__", None)
+    module_name = _COMMON_SCHEMA_NAMES.get(name)  # type: ignore
+    if module_name is None:
+        return None
+    # if the type is used, its module is already imported
+    module = sys.modules.get(module_name)
+    if module is None or getattr(module, name, None) is not class_:  # type: ignore
+        return None
+    return _COMMON_SCHEMA_GETTERS[module_name, name](class_)  # type: ignore
+
+
+class CommonSchemas(Dict[Type, Schema]):
+    """
+    Registry of schemas used by default for some types from standard library.
+    Schemas for types from modules which are not imported by default are added when they are looked up
+    or when the registry is iterated after the module is imported.
+    It can be modified to change default schemas for all factories, removed schemas are not added again
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._removed: Set[Type] = set()
+
+    def _load(self, key: Any) -> Optional[Schema]:
+        if key in self._removed:
+            return None
+        schema = _create_common_schema(key)
+        if schema is None:
+            return None
+        return super().setdefault(key, schema)
+
+    def _load_imported(self) -> None:
+        for module_name, name in _COMMON_SCHEMA_GETTERS:
+            module = sys.modules.get(module_name)
+            class_ = getattr(module, name, None)
+            if class_ is not None and not super().__contains__(class_):
+                self._load(class_)
+
+    def __missing__(self, key: Type) -> Schema:
+        schema = self._load(key)
+        if schema is None:
+            raise KeyError(key)
+        return schema
+
+    def __contains__(self, key: Any) -> bool:
+        return super().__contains__(key) or self._load(key) is not None
+
+    def get(self, key: Type, default: Any = None) -> Any:  # type: ignore
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: Type, default: Schema) -> Schema:  # type: ignore
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __setitem__(self, key: Type, value: Schema) -> None:
+        self._removed.discard(key)
+        super().__setitem__(key, value)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
+        values = dict(*args, **kwargs)
+        self._removed.difference_update(values)
+        super().update(values)
+
+    def __delitem__(self, key: Type) -> None:
+        if key not in self:
+            raise KeyError(key)
+        super().__delitem__(key)
+        self._removed.add(key)
+
+    def pop(self, key: Type, *default: Any) -> Any:  # type: ignore
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        self._removed.add(key)
+        return super().pop(key)
+
+    def popitem(self) -> Tuple[Type, Schema]:
+        self._load_imported()
+        key, value = super().popitem()
+        self._removed.add(key)
+        return key, value
+
+    def clear(self) -> None:
+        self._load_imported()
+        self._removed.update(super().keys())
+        super().clear()
+
+    def copy(self) -> Dict[Type, Schema]:  # type: ignore
+        self._load_imported()
+        return dict(self)
+
+    def keys(self):  # type: ignore
+        self._load_imported()
+        return super().keys()
+
+    def values(self):  # type: ignore
+        self._load_imported()
+        return super().values()
+
+    def items(self):  # type: ignore
+        self._load_imported()
+        return super().items()
+
+    def __iter__(self) -> Iterator[Type]:
+        self._load_imported()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self._load_imported()
+        return super().__len__()
+
+    def __repr__(self) -> str:
+        self._load_imported()
+        return super().__repr__()
+
+
+COMMON_SCHEMAS = CommonSchemas({timedelta: timedelta_schema})
+if hasattr(datetime, "fromisoformat"):
+    COMMON_SCHEMAS.update({
+        datetime: isodatetime_schema,
+        date: isodate_schema,
+        time: isotime_schema,
+    })
+
+
+def get_common_schema(class_: Any) -> Optional[Schema]:
+    """
+    Returns default schema for a type from standard library or None if there is no such schema
+    """
     try:
-        return decimal.Decimal(value)
-    except decimal.InvalidOperation as e:
-        raise ValueError from e
+        return COMMON_SCHEMAS[class_]
+    except KeyError:
+        return None
 
 
-decimal_schema = Schema[decimal.Decimal](
-    parser=_parse_decimal,
-    serializer=lambda x: format(x, "f"),
-)
-COMMON_SCHEMAS[decimal.Decimal] = decimal_schema
+def __getattr__(name: str) -> Any:
+    # decimal module is imported only on first access
+    if name == "decimal_schema":
+        return COMMON_SCHEMAS[import_module("decimal").Decimal]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def type_checker(value: Any, field="type", pre_parse=None) -> Callable:
@@ -73,17 +233,6 @@ unixtime_schema = Schema(
     serializer=datetime.timestamp,
 )
 
-for type_ in (
-    UUID, Path, Fraction,
-    IPv4Address, IPv6Address,
-    IPv4Network, IPv6Network,
-    IPv4Interface, IPv6Interface,
-):
-    COMMON_SCHEMAS[type_] = Schema(
-        serializer=type_.__str__,  # type: ignore
-        parser=type_,
-    )
-
 
 def _stub(data: T) -> T:
     return data
@@ -1,7 +1,8 @@
-from dataclasses import is_dataclass, MISSING
+from dataclasses import MISSING
 from marshal import dumps, loads
 from operator import attrgetter, getitem
-from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+from sys import intern
+from typing import Any, Callable, Dict, List, Optional, Sequence, Sized, Type, Union
 
 from .common import AbstractFactory, K, Serializer, T
 from .fields import (
@@ -12,18 +13,27 @@ from .generics import fix_generic_alias
 from .path_utils import CleanKey, CleanPath, init_structure
 from .schema import Schema, Unknown
 from .type_detection import (
-    hasargs, is_any, is_iterable, is_dict, is_enum, is_generic_concrete,
-    is_newtype, is_optional, is_tuple, is_type_var, is_typeddict, is_union,
-    is_literal, is_literal36, instance_wont_have_dict, is_none, is_namedtuple,
+    classify, hasargs, instance_wont_have_dict, is_generic_concrete, is_none, TypeKind,
 )
 
 
+NOT_CHECKED = object()  # field value is not compared with default
+
+
 def to_path(key: Union[CleanKey, CleanPath]) -> CleanPath:
     if isinstance(key, tuple):
         return key
     return (key,)
 
 
+def intern_key(key: Union[CleanKey, CleanPath]) -> Union[CleanKey, CleanPath]:
+    if isinstance(key, str):
+        return intern(key)
+    if isinstance(key, tuple):
+        return tuple(intern_key(x) for x in key)  # type: ignore
+    return key
+
+
 def unpack_fields(dest, fields):
     for f in fields:
         dest.update(dest.pop(f, {}))
@@ -40,13 +50,22 @@ def get_complex_serializer(
     :param getter: functions used to get data for each field (attribute, key and so on)
     :param omit_missing: omit special MISSING values retrieved from getter. Is applied when all defaults are MISSING.
     """
-    has_default = schema.omit_default and any(f.default != MISSING for f in fields)
-    if omit_missing:
-        has_default = has_default or all(f.default == MISSING for f in fields)
+    omit_none = bool(schema.omit_none)
+    omit_empty = bool(schema.omit_empty)
+    # field values are compared with defaults before serialization, NOT_CHECKED is never equal to them
     field_info = tuple(
-        (f.field_name, factory.serializer(f.type), f.data_name, f.default)
+        (
+            f.field_name,
+            factory.serializer(f.type),
+            f.data_name,
+            f.default if (
+                (schema.omit_default and f.default is not MISSING) or
+                (omit_missing and f.default is MISSING)
+            ) else NOT_CHECKED,
+        )
         for f in fields
     )
+    has_default = any(default is not NOT_CHECKED for _, _, _, default in field_info)
     unknown=schema.unknown
     if isinstance(unknown, Unknown):
         unpack_unknown = False
@@ -57,11 +76,14 @@ def get_complex_serializer(
         unpack_unknown = True
 
     if schema.name_mapping and any(isinstance(key, tuple) for key in schema.name_mapping.values()):
-        paths = tuple(to_path(f.data_name) for f in fields)
+        # containers are unmarshalled on each call, only interned keys are not copied but shared by all of them
+        paths = tuple(to_path(intern_key(f.data_name)) for f in fields)
         pickled = dumps(init_structure(paths))
-        if has_default:
+        if has_default or omit_none or omit_empty:
             if schema.omit_default:
                 raise ValueError("Cannot use `omit_default` option with flattening schema")
+            elif omit_none or omit_empty:
+                raise ValueError("Cannot use `omit_none` or `omit_empty` option with flattening schema")
             else:
                 raise ValueError("Cannot omit missing values with flattening schema")
 
@@ -75,14 +97,22 @@ def get_complex_serializer(
                 unpack_fields(container, unknown)
             return container
     else:
-        if has_default:
+        if has_default or omit_none or omit_empty:
+            # values are checked before serialization, so omitted ones are not serialized at all
             def serialize(data):
-                container = {
-                    data_name: value
-                    for field_name, serializer, data_name, default in field_info
-                    for value in (serializer(getter(data, field_name)),)
-                    if value != default
-                }
+                container = {}
+                for field_name, serializer, data_name, default in field_info:
+                    value = getter(data, field_name)
+                    if value is default:
+                        continue
+                    if value is None:
+                        if omit_none:
+                            continue
+                    elif omit_empty and isinstance(value, Sized) and len(value) == 0:
+                        continue
+                    if default is not NOT_CHECKED and value == default:
+                        continue
+                    container[data_name] = serializer(value)
                 if unpack_unknown:
                     unpack_fields(container, unknown)
                 return container
@@ -99,22 +129,30 @@ def get_complex_serializer(
     return serialize
 
 
-def get_collection_serializer(serializer: Serializer[T]) -> Serializer[List[T]]:
+def get_collection_serializer(serializer: Serializer[T], zero_copy: bool = False) -> Serializer[List[T]]:
+    if serializer is stub_serializer:
+        return get_collection_any_serializer(zero_copy)
+
     def collection_serializer(data):
         return [serializer(x) for x in data]
 
     return collection_serializer
 
 
-def get_tuple_serializer(serializers) -> Serializer[List]:
+def get_tuple_serializer(serializers, zero_copy: bool = False) -> Serializer[List]:
+    if all(serializer is stub_serializer for serializer in serializers):
+        return get_collection_any_serializer(zero_copy)
+
     def tuple_serializer(data):
         return [serializer(x) for x, serializer in zip(data, serializers)]
 
     return tuple_serializer
 
 
-def get_collection_any_serializer() -> Serializer[List[Any]]:
-    return lambda data: list(data)
+def get_collection_any_serializer(zero_copy: bool = False) -> Serializer[List[Any]]:
+    if zero_copy:
+        return lambda data: data if type(data) is list else list(data)
+    return list
 
 
 def get_vars_serializer(factory) -> Serializer:
@@ -139,8 +177,12 @@ def stub_serializer(data: T) -> T:
 
 
 def get_dict_serializer(
-    key_serializer: Serializer[K], serializer: Serializer[T]
+    key_serializer: Serializer[K], serializer: Serializer[T], zero_copy: bool = False,
 ) -> Serializer[Dict[Any, Any]]:
+    if key_serializer is stub_serializer and serializer is stub_serializer:
+        if zero_copy:
+            return lambda data: data if type(data) is dict else dict(data)
+        return dict
     return lambda data: {
         key_serializer(k): serializer(v) for k, v in data.items()
     }
@@ -154,6 +196,9 @@ def get_lazy_serializer(factory) -> Serializer:
 
 
 def get_optional_serializer(serializer: Serializer[T]) -> Serializer[Optional[T]]:
+    if serializer is stub_serializer:
+        return stub_serializer
+
     def optional_serializer(data):
         if data is None:
             return None
@@ -183,17 +228,16 @@ def create_serializer(factory, schema: Schema, debug_path: bool, class_: Type) -
 def create_serializer_impl(factory, schema: Schema, debug_path: bool,
                            class_: Type) -> Serializer:  # noqa C901,CCR001
     class_ = fix_generic_alias(class_)
-    if class_ in (str, bytearray, bytes, int, float, complex, bool):
+    kind = classify(class_)
+    if kind is TypeKind.PRIMITIVE or kind is TypeKind.LITERAL:
         return stub_serializer
-    if is_none(class_):
+    if kind is TypeKind.NONE:
         return serialize_none
-    if is_literal(class_) or is_literal36(class_) or is_none(class_):
-        return stub_serializer
-    if is_newtype(class_):
+    if kind is TypeKind.NEWTYPE:
         return create_serializer_impl(factory, schema, debug_path, class_.__supertype__)
-    if is_type_var(class_):
+    if kind is TypeKind.TYPE_VAR or kind is TypeKind.ANY:
         return get_lazy_serializer(factory)
-    if is_dataclass(class_) or (is_generic_concrete(class_) and is_dataclass(class_.__origin__)):
+    if kind is TypeKind.DATACLASS:
         return get_complex_serializer(
             factory,
             schema,
@@ -201,7 +245,7 @@ def create_serializer_impl(factory, schema: Schema, debug_path: bool,
             getattr,
             False,
         )
-    if is_namedtuple(class_):
+    if kind is TypeKind.NAMEDTUPLE:
         return get_complex_serializer(
             factory,
             schema,
@@ -209,7 +253,7 @@ def create_serializer_impl(factory, schema: Schema, debug_path: bool,
             getattr,
             False,
         )
-    if is_typeddict(class_) or (is_generic_concrete(class_) and is_typeddict(class_.__origin__)):
+    if kind is TypeKind.TYPEDDICT:
         if class_.__total__:
             return get_complex_serializer(
                 factory,
@@ -226,18 +270,14 @@ def create_serializer_impl(factory, schema: Schema, debug_path: bool,
                 lambda obj, key: obj.get(key, MISSING),
                 True,
             )
-    if is_any(class_):
-        return get_lazy_serializer(factory)
-    if class_ in (str, bytearray, bytes, int, float, complex, bool):
-        return class_
-    if is_optional(class_):
+    if kind is TypeKind.OPTIONAL:
         if class_.__args__:
             return get_optional_serializer(class_.__args__[0])
         else:
             return get_lazy_serializer(factory)
-    if is_enum(class_):
+    if kind is TypeKind.ENUM:
         return attrgetter("value")
-    if is_union(class_):
+    if kind is TypeKind.UNION:
         # also, check if Union can be converted to Optional[...] or Optional[Union[...]]
         serializers = tuple(factory.serializer(x) for x in class_.__args__ if not is_none(x))
         if len(serializers) == 0:
@@ -249,27 +289,27 @@ def create_serializer_impl(factory, schema: Schema, debug_path: bool,
         if len(serializers) < len(class_.__args__):
             return get_optional_serializer(serializer)
         return serializer
-    if is_tuple(class_):
+    if kind is TypeKind.TUPLE:
         if not hasargs(class_):
             return get_collection_any_serializer()
         elif len(class_.__args__) == 2 and class_.__args__[1] is Ellipsis:
             item_serializer = factory.serializer(class_.__args__[0])
-            return get_collection_serializer(item_serializer)
+            return get_collection_serializer(item_serializer, bool(schema.zero_copy))
         else:
-            return get_tuple_serializer(tuple(factory.serializer(x) for x in class_.__args__))
-    if is_generic_concrete(class_) and is_dict(class_.__origin__):
+            return get_tuple_serializer(tuple(factory.serializer(x) for x in class_.__args__), bool(schema.zero_copy))
+    if kind is TypeKind.DICT:
+        if not is_generic_concrete(class_):
+            return get_dict_serializer(get_lazy_serializer(factory), get_lazy_serializer(factory))
         key_type_arg = class_.__args__[0] if class_.__args__ else Any
         value_type_arg = class_.__args__[1] if class_.__args__ else Any
         return get_dict_serializer(factory.serializer(key_type_arg),
-                                   factory.serializer(value_type_arg))
-    if is_dict(class_):
-        return get_dict_serializer(get_lazy_serializer(factory), get_lazy_serializer(factory))
-    if is_generic_concrete(class_) and is_iterable(class_.__origin__):
+                                   factory.serializer(value_type_arg),
+                                   bool(schema.zero_copy))
+    if kind is TypeKind.ITERABLE:
+        if not is_generic_concrete(class_):
+            return get_collection_serializer(get_lazy_serializer(factory))
         item_serializer = factory.serializer(class_.__args__[0] if class_.__args__ else Any)
-        return get_collection_serializer(item_serializer)
-    if is_iterable(class_):
-        item_serializer = get_lazy_serializer(factory)
-        return get_collection_serializer(item_serializer)
+        return get_collection_serializer(item_serializer, bool(schema.zero_copy))
 
     if isinstance(class_, type):
         if instance_wont_have_dict(class_):
@@ -1,13 +1,15 @@
 from collections import defaultdict
+from dataclasses import is_dataclass
 from enum import Enum
 import inspect
+from threading import Lock
 from typing import (
     Any, Collection, Dict, Generic, List, Optional, Tuple, Type, TypeVar,
     Union, get_type_hints, Iterable, DefaultDict,
 )
+from weakref import WeakKeyDictionary
 
 LITERAL_TYPES: List[Any] = []
-TYPED_DICT_METAS_TMP: List[Any] = []
 try:
     from typing import Literal as PyLiteral  # type: ignore
 
@@ -28,30 +30,37 @@ try:
 except ImportError:
     UnionType = None  # type: ignore
 
-try:
-    from typing import TypedDict as PyTypedDict  # type: ignore
-
+_typed_dict_metas: Optional[Tuple[Any, ...]] = None
 
-    class RealPyTypedDict(PyTypedDict):
-        pass  # create real class, because PyTypedDict can be helper function
 
+def get_typed_dict_metas() -> Tuple[Any, ...]:
+    """
+    Returns metaclasses of TypedDict implementations.
+    Probe classes are created on first call, not during import
+    """
+    global _typed_dict_metas
+    if _typed_dict_metas is not None:
+        return _typed_dict_metas
+    metas = []
+    try:
+        from typing import TypedDict as PyTypedDict  # type: ignore
 
-    TYPED_DICT_METAS_TMP.append(type(RealPyTypedDict))
-except ImportError:
-    pass
+        class RealPyTypedDict(PyTypedDict):
+            pass  # create real class, because PyTypedDict can be helper function
 
-try:
-    from typing_extensions import TypedDict as CompatTypedDict  # type: ignore
-    # This is a hack. It exists because typing_extensions.TypedDict
-    # is not guaranteed to be a type, it can also be a function (which it is in 3.9)
-    _Foo = CompatTypedDict("_Foo", {})
-    TYPED_DICT_METAS_TMP.append(type(_Foo))
-    del _Foo
-except ImportError:
-    pass
+        metas.append(type(RealPyTypedDict))
+    except ImportError:
+        pass
 
-TYPED_DICT_METAS = tuple(TYPED_DICT_METAS_TMP)
-del TYPED_DICT_METAS_TMP
+    try:
+        from typing_extensions import TypedDict as CompatTypedDict  # type: ignore
+        # This is a hack. It exists because typing_extensions.TypedDict
+        # is not guaranteed to be a type, it can also be a function (which it is in 3.9)
+        metas.append(type(CompatTypedDict("_Foo", {})))
+    except ImportError:
+        pass
+    _typed_dict_metas = tuple(metas)
+    return _typed_dict_metas
 
 
 def get_self_type_hints(cls: Type) -> Dict[str, Type]:
@@ -112,9 +121,10 @@ def is_iterable(type_) -> bool:
 
 
 def is_typeddict(type_) -> bool:
-    if not TYPED_DICT_METAS:
+    metas = get_typed_dict_metas()
+    if not metas:
         return False
-    return isinstance(type_, TYPED_DICT_METAS)
+    return isinstance(type_, metas)
 
 
 def is_namedtuple(type_) -> bool:
@@ -210,3 +220,119 @@ def instance_wont_have_dict(cls) -> bool:
     slots_sign = hasattr(cls, '__slots__') and '__dict__' not in cls.__slots__
 
     return dict_offset_sign or slots_sign
+
+
+class TypeKind(Enum):
+    ANY = "any"
+    NONE = "none"
+    LITERAL = "literal"
+    OPTIONAL = "optional"
+    PRIMITIVE = "primitive"
+    NEWTYPE = "newtype"
+    TYPE_VAR = "type_var"
+    ENUM = "enum"
+    NAMEDTUPLE = "namedtuple"
+    TUPLE = "tuple"
+    DICT = "dict"
+    TYPEDDICT = "typeddict"
+    DATACLASS = "dataclass"
+    UNION = "union"
+    ITERABLE = "iterable"
+    OTHER = "other"
+
+
+PRIMITIVE_TYPES = (str, bytearray, bytes, int, float, complex, bool)
+
+# kinds of widely used types, found without any checks
+_TYPE_KINDS: Dict[Any, TypeKind] = {
+    Any: TypeKind.ANY,
+    inspect.Parameter.empty: TypeKind.ANY,
+    None: TypeKind.NONE,
+    type(None): TypeKind.NONE,
+    Optional: TypeKind.OPTIONAL,
+    **{x: TypeKind.PRIMITIVE for x in PRIMITIVE_TYPES},
+    tuple: TypeKind.TUPLE,
+    Tuple: TypeKind.TUPLE,
+    dict: TypeKind.DICT,
+    Dict: TypeKind.DICT,
+    defaultdict: TypeKind.DICT,
+    DefaultDict: TypeKind.DICT,
+    list: TypeKind.ITERABLE,
+    List: TypeKind.ITERABLE,
+    set: TypeKind.ITERABLE,
+    frozenset: TypeKind.ITERABLE,
+}
+# kinds of generic types by their `__origin__`
+_ORIGIN_KINDS: Dict[Any, TypeKind] = {
+    Union: TypeKind.UNION,
+    tuple: TypeKind.TUPLE,
+    dict: TypeKind.DICT,
+    defaultdict: TypeKind.DICT,
+    list: TypeKind.ITERABLE,
+    set: TypeKind.ITERABLE,
+    frozenset: TypeKind.ITERABLE,
+    **{x: TypeKind.LITERAL for x in LITERAL_TYPES},
+}
+_type_kinds: "WeakKeyDictionary[Any, TypeKind]" = WeakKeyDictionary()
+_type_kinds_lock = Lock()
+
+
+def detect_kind(type_: Any) -> TypeKind:  # noqa C901,CCR001
+    if is_any(type_):
+        return TypeKind.ANY
+    if is_none(type_):
+        return TypeKind.NONE
+    if is_literal(type_) or is_literal36(type_):
+        return TypeKind.LITERAL
+    if is_optional(type_):
+        return TypeKind.OPTIONAL
+    if type_ in PRIMITIVE_TYPES:
+        return TypeKind.PRIMITIVE
+    if is_newtype(type_):
+        return TypeKind.NEWTYPE
+    if is_type_var(type_):
+        return TypeKind.TYPE_VAR
+    if is_enum(type_):
+        return TypeKind.ENUM
+    if is_namedtuple(type_):
+        return TypeKind.NAMEDTUPLE
+    if is_tuple(type_):
+        return TypeKind.TUPLE
+    if is_dict(type_):
+        return TypeKind.DICT
+    origin = type_.__origin__ if is_generic_concrete(type_) else None
+    if is_typeddict(type_) or (origin is not None and is_typeddict(origin)):
+        return TypeKind.TYPEDDICT
+    if is_dataclass(type_) or (origin is not None and is_dataclass(origin)):
+        return TypeKind.DATACLASS
+    if is_union(type_):
+        return TypeKind.UNION
+    if is_iterable(type_):
+        return TypeKind.ITERABLE
+    return TypeKind.OTHER
+
+
+def classify(type_: Any) -> TypeKind:
+    """
+    Returns kind of a type. Generic aliases must be normalized using `fix_generic_alias`.
+    Result is memoized, so checks are done once for each type
+    """
+    try:
+        kind = _TYPE_KINDS.get(type_)
+    except TypeError:  # unhashable
+        return detect_kind(type_)
+    if kind is not None:
+        return kind
+    if is_generic_concrete(type_):
+        kind = _ORIGIN_KINDS.get(type_.__origin__)
+        if kind is not None:
+            return kind
+    try:
+        kind = _type_kinds.get(type_)
+    except TypeError:  # cannot be weakly referenced
+        return detect_kind(type_)
+    if kind is None:
+        kind = detect_kind(type_)
+        with _type_kinds_lock:
+            kind = _type_kinds.setdefault(type_, kind)
+    return kind
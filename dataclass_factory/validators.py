@@ -2,7 +2,9 @@
 #
 #
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakKeyDictionary
 
 from .common import Parser, T
 
@@ -30,6 +32,18 @@ def combine_parser_validators(
 class ValidatorInfo:
     pre_parse: bool
     field: Optional[str]
+    batch: bool = False
+    as_array: bool = False
+
+
+def add_validator_info(func, fields: Sequence[Optional[str]], **kwargs):
+    try:
+        vi = func.dataclass_factory_validate_info
+    except AttributeError:
+        func.dataclass_factory_validate_info = vi = []
+    for fieldname in fields:
+        vi.append(ValidatorInfo(field=fieldname, **kwargs))
+    return func
 
 
 def validate(*fields: Optional[str], pre: bool = False):
@@ -46,35 +60,100 @@ def validate(*fields: Optional[str], pre: bool = False):
     :param pre: flag to call validator before parsing corresponding value
     """
     def dec(func):
-        try:
-            vi = func.dataclass_factory_validate_info
-        except AttributeError:
-            func.dataclass_factory_validate_info = vi = []
-        for fieldname in fields:
-            vi.append(ValidatorInfo(field=fieldname, pre_parse=pre))
-        return func
+        return add_validator_info(func, fields, pre_parse=pre)
 
     if not fields:
         fields = (None, )
     return dec
 
 
-def fill_validators(func, infos: List[ValidatorInfo], pre, post):
+def validate_batch(*fields: Optional[str], as_array: bool = False):
+    """
+    Decorator to set a method as a validator of parsed collection (e.g. `List[T]`).
+    Such method will be called once after all items of collection are parsed.
+
+    Validator method receives list of values of the field from all items
+    and raises ValueError if they are invalid. Returned value is ignored
+
+    :param fields: names of fields (as they are in target class)
+                   which are processed by this validator.
+                   None is treated as "whole items"
+    :param as_array: pass values as numpy array if numpy is installed
+    """
+    def dec(func):
+        return add_validator_info(func, fields, pre_parse=False, batch=True, as_array=as_array)
+
+    if not fields:
+        fields = (None, )
+    return dec
+
+
+@lru_cache(maxsize=None)
+def get_numpy() -> Any:
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+def get_array_validator(func: Callable[[Any], Any]) -> Callable[[List[Any]], Any]:
+    def array_validator(values):
+        numpy = get_numpy()
+        if numpy is None:
+            return func(values)
+        return func(numpy.asarray(values))
+
+    return array_validator
+
+
+def fill_validators(func, infos: List[ValidatorInfo], pre, post, batch):
     for info in infos:
-        if info.pre_parse:
+        if info.batch:
+            batch.setdefault(info.field, []).append(get_array_validator(func) if info.as_array else func)
+        elif info.pre_parse:
             pre.setdefault(info.field, []).append(func)
         else:
             post.setdefault(info.field, []).append(func)
 
 
-def prepare_validators(object):
-    pre = {}
-    post = {}
+# names of attributes which are validators, found once for each class
+_class_validators: "WeakKeyDictionary[type, List[str]]" = WeakKeyDictionary()
 
-    for x in dir(object):
+
+def get_validator_names(cls: type) -> List[str]:
+    names = _class_validators.get(cls)
+    if names is None:
+        names = [
+            x for x in dir(cls)
+            if hasattr(getattr(cls, x, None), "dataclass_factory_validate_info")
+        ]
+        _class_validators[cls] = names
+    return names
+
+
+ValidatorsByField = Dict[Optional[str], List[Callable]]
+
+
+def prepare_validators(object) -> Tuple[ValidatorsByField, ValidatorsByField, ValidatorsByField]:
+    """
+    Finds validators bound to object. Returns pre-parse, post-parse and batch validators by field name
+    """
+    pre: ValidatorsByField = {}
+    post: ValidatorsByField = {}
+    batch: ValidatorsByField = {}
+
+    names = get_validator_names(type(object))
+    own_names = [
+        x for x, atr in vars(object).items()
+        if hasattr(atr, "dataclass_factory_validate_info")
+    ]
+    if own_names:
+        names = sorted(set(names).union(own_names))
+    for x in names:
         atr = getattr(object, x)
         try:
-            fill_validators(atr, atr.dataclass_factory_validate_info, pre, post)
+            fill_validators(atr, atr.dataclass_factory_validate_info, pre, post, batch)
         except AttributeError:
             pass
-    return pre, post
+    return pre, post, batch
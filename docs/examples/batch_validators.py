@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import List
+
+from dataclass_factory import validate_batch, Factory, Schema
+
+
+class OrderSchema(Schema):
+    @validate_batch("id")  # called once with ids of all parsed orders
+    def validate_unique(self, ids):
+        if len(set(ids)) != len(ids):
+            raise ValueError("Order ids must be unique")
+
+    @validate_batch()  # called once with all parsed orders
+    def validate_total(self, orders):
+        if sum(order.amount for order in orders) > 1000:
+            raise ValueError("Total amount is too big")
+
+
+@dataclass
+class Order:
+    id: int
+    amount: int
+
+
+factory = Factory(schemas={Order: OrderSchema()})
+
+result = factory.load([{"id": 1, "amount": 10}, {"id": 2, "amount": 20}], List[Order])
+assert result == [Order(1, 10), Order(2, 20)]
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+
+from dataclass_factory import Factory, InvalidFieldError, NameStyle, Schema, Unknown, UnknownFieldsError, validate
+
+
+@dataclass
+class User:
+    user_id: int
+    name: str = ""
+
+
+class TestAliases(TestCase):
+    def setUp(self):
+        self.factory = Factory(schemas={
+            User: Schema(name_style=NameStyle.camel_lower, aliases={"user_id": ["user_id", "uid"]}),
+        })
+
+    def test_load(self):
+        for data in ({"userId": 1}, {"user_id": 1}, {"uid": 1}):
+            with self.subTest(data=data):
+                self.assertEqual(self.factory.load(data, User), User(1))
+
+    def test_priority(self):
+        self.assertEqual(self.factory.load({"uid": 3, "userId": 1, "user_id": 2}, User), User(1))
+        self.assertEqual(self.factory.load({"uid": 3, "user_id": 2}, User), User(2))
+
+    def test_only_selected_parsed(self):
+        self.assertEqual(self.factory.load({"user_id": 5, "uid": "bad"}, User), User(5))
+        self.assertEqual(self.factory.load({"uid": "bad", "user_id": 5}, User), User(5))
+
+        class ValidatingSchema(Schema):
+            @validate("user_id", pre=True)
+            def check(self, data):
+                if data == "bad":
+                    raise ValueError("Not selected value is validated")
+                return data
+
+        factory = Factory(schemas={User: ValidatingSchema(aliases={"user_id": ["uid"]})})
+        self.assertEqual(factory.load({"uid": "bad", "user_id": 5}, User), User(5))
+
+    def test_dump(self):
+        self.assertEqual(self.factory.dump(User(1, "a")), {"userId": 1, "name": "a"})
+
+    def test_unknown(self):
+        factory = Factory(schemas={User: Schema(aliases={"user_id": ["uid"]}, unknown=Unknown.FORBID)})
+        self.assertEqual(factory.load({"uid": 1}, User), User(1))
+        with self.assertRaises(UnknownFieldsError):
+            factory.load({"uid": 1, "other": 2}, User)
+
+    def test_flattened(self):
+        factory = Factory(schemas={
+            User: Schema(name_mapping={"user_id": ("user", "id")}, aliases={"user_id": ["uid"]}),
+        })
+        self.assertEqual(factory.load({"user": {"id": 1}}, User), User(1))
+        self.assertEqual(factory.load({"uid": 1}, User), User(1))
+
+    def test_debug_path(self):
+        factory = Factory(schemas={User: Schema(aliases={"user_id": ["uid"]})}, debug_path=True)
+        with self.assertRaises(InvalidFieldError) as e:
+            factory.load([{"uid": "x"}], List[User])
+        self.assertEqual(e.exception.field_path, ["user_id", "0"])
+
+    def test_load_many(self):
+        result = self.factory.load_many([{"uid": 1}, {"uid": "x"}], User, errors="collect")
+        self.assertEqual(result.items, [User(1)])
+        self.assertEqual(list(result.errors[1]), [("uid",)])
+
+    def test_conflict(self):
+        factory = Factory(schemas={User: Schema(aliases={"user_id": ["name"]})})
+        with self.assertRaises(ValueError):
+            factory.parser(User)
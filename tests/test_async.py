@@ -0,0 +1,113 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+from unittest import TestCase
+
+from dataclass_factory import Factory, InvalidFieldError, Schema, validate_batch
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+@dataclass
+class Batch:
+    items: List[Item]
+
+
+async def lines(*items):
+    for item in items:
+        yield item
+
+
+async def collect(iterator):
+    return [x async for x in iterator]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class UniqueSchema(Schema):
+    @validate_batch("id")
+    def unique(self, ids):
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate ids")
+
+
+class TestAsync(TestCase):
+    def setUp(self):
+        self.factory = Factory()
+        self.data = [{"id": i, "name": str(i)} for i in range(25)]
+        self.expected = [Item(i, str(i)) for i in range(25)]
+
+    def test_aload_inline(self):
+        self.assertEqual(run(self.factory.aload(self.data, List[Item])), self.expected)
+
+    def test_aload_chunked(self):
+        self.assertEqual(run(self.factory.aload(self.data, List[Item], chunk_size=10)), self.expected)
+        self.assertEqual(
+            run(self.factory.aload(self.data, Tuple[Item, ...], chunk_size=10)),
+            tuple(self.expected),
+        )
+        self.assertEqual(run(self.factory.aload(list(range(25)), Set[int], chunk_size=10)), set(range(25)))
+
+    def test_aload_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+            res = run(self.factory.aload(
+                self.data, List[Item], chunk_size=10, offload_threshold=20, executor=executor,
+            ))
+        self.assertEqual(res, self.expected)
+
+    def test_aload_executor_nested(self):
+        threads = []
+
+        def post_parse(batch):
+            threads.append(threading.current_thread())
+            return batch
+
+        factory = Factory(schemas={Batch: Schema(post_parse=post_parse)})
+        with ThreadPoolExecutor(1) as executor:
+            res = run(factory.aload(
+                {"items": self.data}, Batch, chunk_size=10, offload_threshold=20, executor=executor,
+            ))
+            self.assertEqual(res, Batch(self.expected))
+            res = run(factory.aload({"items": self.data[:2]}, Batch, offload_threshold=20, executor=executor))
+            self.assertEqual(res, Batch(self.expected[:2]))
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertIs(threads[1], threading.main_thread())
+
+    def test_aload_debug_path(self):
+        factory = Factory(debug_path=True)
+        self.data[17]["id"] = "x"
+        with self.assertRaises(InvalidFieldError) as e:
+            run(factory.aload(self.data, List[Item], chunk_size=10))
+        self.assertEqual(e.exception.field_path, ["id", "17"])
+
+    def test_aload_batch_validators(self):
+        factory = Factory(schemas={Item: UniqueSchema()})
+        self.assertEqual(run(factory.aload(self.data, List[Item], chunk_size=10)), self.expected)
+        self.data[17]["id"] = 1
+        with self.assertRaises(ValueError):
+            run(factory.aload(self.data, List[Item], chunk_size=10))
+        with self.assertRaises(ValueError):
+            factory.load(self.data, Tuple[Item, ...])
+
+    def test_adump(self):
+        self.assertEqual(run(self.factory.adump(self.expected, List[Item], chunk_size=10)), self.data)
+        self.assertEqual(run(self.factory.adump(self.expected, chunk_size=10)), self.data)
+        self.assertEqual(run(self.factory.adump(self.expected[0])), self.data[0])
+
+    def test_aload_iter(self):
+        source = lines(b'{"id": 1, "name": "a"}\n', b"\n", b'{"id": 2, "name": "b"}\n')
+        res = run(collect(self.factory.aload_iter(source, Item, chunk_size=1)))
+        self.assertEqual(res, [Item(1, "a"), Item(2, "b")])
+
+    def test_aload_iter_decoded(self):
+        source = lines(*self.data)
+        res = run(collect(self.factory.aload_iter(source, Item, loads=None)))
+        self.assertEqual(res, self.expected)
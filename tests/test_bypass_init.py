@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field, InitVar
+from typing import Generic, List, NamedTuple, TypeVar
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+
+T = TypeVar("T")
+
+
+@dataclass
+class Data:
+    a: int
+    b: str = "b"
+    c: List[int] = field(default_factory=list)
+    d: int = field(init=False, default=4)
+
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("__init__ must not be called")
+
+
+@dataclass
+class PostInit:
+    a: int
+    b: int = field(init=False)
+
+    def __post_init__(self):
+        self.b = self.a * 2
+
+
+@dataclass
+class WithInitVar:
+    a: int
+    b: InitVar[int] = 0
+
+    def __post_init__(self, b):
+        self.a += b
+
+
+@dataclass(frozen=True)
+class Frozen:
+    a: int
+
+
+@dataclass
+class GenericData(Generic[T]):
+    value: T
+
+
+class Point(NamedTuple):
+    x: int
+    y: int = 0
+
+
+class TestBypassInit(TestCase):
+    def setUp(self):
+        self.factory = Factory(default_schema=Schema(bypass_init=True))
+
+    def test_dataclass(self):
+        res = self.factory.load({"a": 1}, Data)
+        self.assertEqual((res.a, res.b, res.c, res.d), (1, "b", [], 4))
+        other = self.factory.load({"a": 1, "b": "x", "c": [1]}, Data)
+        self.assertEqual((other.a, other.b, other.c), (1, "x", [1]))
+        self.assertIsNot(res.c, self.factory.load({"a": 1}, Data).c)
+
+    def test_missing(self):
+        with self.assertRaises(TypeError):
+            self.factory.load({}, Data)
+
+    def test_post_init(self):
+        self.assertEqual(self.factory.load({"a": 2}, PostInit).b, 4)
+
+    def test_initvar_fallback(self):
+        self.assertEqual(self.factory.load({"a": 2}, WithInitVar), WithInitVar(2))
+
+    def test_frozen(self):
+        self.assertEqual(self.factory.load({"a": 2}, Frozen), Frozen(2))
+
+    def test_generic(self):
+        res = self.factory.load({"value": 1}, GenericData[int])
+        self.assertEqual(res, GenericData(1))
+        self.assertEqual(res.__orig_class__, GenericData[int])
+
+    def test_namedtuple(self):
+        self.assertEqual(self.factory.load({"x": 1}, Point), Point(1, 0))
+        self.assertEqual(self.factory.load({"x": 1, "y": 2}, Point), Point(1, 2))
+        with self.assertRaises(TypeError):
+            self.factory.load({"y": 1}, Point)
@@ -0,0 +1,80 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any, Deque, Dict, FrozenSet, Generic, List, NamedTuple, NewType, Optional,
+    Sequence, Tuple, TypeVar, Union,
+)
+from unittest import TestCase
+
+from typing_extensions import Literal, TypedDict
+
+from dataclass_factory import type_detection
+from dataclass_factory.type_detection import classify, TypeKind
+
+T = TypeVar("T")
+
+
+@dataclass
+class Data(Generic[T]):
+    value: T
+
+
+class Point(NamedTuple):
+    x: int
+
+
+class Color(Enum):
+    red = "red"
+
+
+class Movie(TypedDict):
+    name: str
+
+
+class MyList(List[int]):
+    pass
+
+
+class TestClassification(TestCase):
+    def test_kinds(self):
+        cases = [
+            (Any, TypeKind.ANY),
+            (None, TypeKind.NONE),
+            (type(None), TypeKind.NONE),
+            (Literal["a"], TypeKind.LITERAL),
+            (Optional, TypeKind.OPTIONAL),
+            (str, TypeKind.PRIMITIVE),
+            (bool, TypeKind.PRIMITIVE),
+            (NewType("UserId", int), TypeKind.NEWTYPE),
+            (T, TypeKind.TYPE_VAR),
+            (Color, TypeKind.ENUM),
+            (Point, TypeKind.NAMEDTUPLE),
+            (tuple, TypeKind.TUPLE),
+            (Tuple[int, ...], TypeKind.TUPLE),
+            (dict, TypeKind.DICT),
+            (Dict[str, int], TypeKind.DICT),
+            (Movie, TypeKind.TYPEDDICT),
+            (Data, TypeKind.DATACLASS),
+            (Data[int], TypeKind.DATACLASS),
+            (Optional[int], TypeKind.UNION),
+            (Union[int, str], TypeKind.UNION),
+            (List[int], TypeKind.ITERABLE),
+            (Sequence[int], TypeKind.ITERABLE),
+            (FrozenSet[int], TypeKind.ITERABLE),
+            (Deque[int], TypeKind.ITERABLE),
+            (deque, TypeKind.ITERABLE),
+            (MyList, TypeKind.ITERABLE),
+            (object, TypeKind.OTHER),
+        ]
+        for type_, kind in cases:
+            with self.subTest(type_=type_):
+                self.assertIs(classify(type_), kind)
+                self.assertIs(type_detection.detect_kind(type_), kind)
+
+    def test_memoized(self):
+        class Local:
+            pass
+
+        self.assertIs(classify(Local), TypeKind.OTHER)
+        self.assertIs(type_detection._type_kinds[Local], TypeKind.OTHER)
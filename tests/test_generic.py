@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Generic, TypeVar, List, Tuple
 from unittest import TestCase
+from unittest.mock import patch
 
-from dataclass_factory import Factory, Schema
+from dataclass_factory import Factory, generics, Schema
+from dataclass_factory.generics import fix_generic_alias, resolve_hints
 
 T = TypeVar('T')
 V = TypeVar('V')
@@ -119,3 +121,12 @@ class TestGeneric(TestCase):
         parsed = [(1, "2")]
         self.assertEqual(self.factory.load(data, ListTuple[int, V][str]), parsed)
         self.assertEqual(self.factory.dump(parsed, ListTuple[int, V][str]), data)
+
+    def test_specialization_cache(self):
+        self.assertEqual(resolve_hints(FooBar[int, str]), {"value": int, "value2": str, "value3": int})
+        self.assertIs(fix_generic_alias(ListList[int]), fix_generic_alias(ListList[int]))
+        Factory().load({"foo": {"value": 1}}, FooBaz[int])
+        with patch.object(generics, "get_self_type_hints", side_effect=AssertionError):
+            self.assertEqual(resolve_hints(FooBar[int, str])["value2"], str)
+            self.assertEqual(Factory().load({"foo": {"value": 1}}, FooBaz[int]), FooBaz(Foo(1)))
+        self.assertEqual(resolve_hints(FooBar[str, int])["value2"], int)
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+from uuid import UUID
+
+from dataclass_factory import Factory, Schema, schema_helpers
+
+CODE = """
+import sys
+import dataclass_factory
+print(" ".join(sorted(sys.modules)))
+"""
+
+
+class TestImport(TestCase):
+    def test_lazy_modules(self):
+        result = subprocess.run([sys.executable, "-c", CODE], stdout=subprocess.PIPE, check=True)
+        modules = set(result.stdout.decode().split())
+        for name in (
+            "asyncio", "concurrent.futures", "decimal", "fractions", "ipaddress", "uuid",
+            "dataclass_factory.deprecated_stuff", "dataclass_factory.jsonschema",
+        ):
+            with self.subTest(name=name):
+                self.assertNotIn(name, modules)
+
+    def test_deprecated_names(self):
+        import dataclass_factory
+        self.assertTrue(callable(dataclass_factory.dict_factory))
+        with self.assertRaises(AttributeError):
+            dataclass_factory.missing_name  # noqa B018
+
+    def test_common_schemas(self):
+        factory = Factory()
+        self.assertEqual(factory.load("1.5", Decimal), Decimal("1.5"))
+        uuid = UUID(int=1)
+        self.assertEqual(factory.dump(uuid), str(uuid))
+        self.assertIs(schema_helpers.COMMON_SCHEMAS[Decimal], schema_helpers.decimal_schema)
+
+    def test_common_schemas_registry(self):
+        schema = Schema(parser=lambda x: UUID(int=x), serializer=lambda x: x.int)
+        with patch.dict(schema_helpers.COMMON_SCHEMAS, {UUID: schema}):
+            factory = Factory()
+            self.assertEqual(factory.load(1, UUID), UUID(int=1))
+            self.assertEqual(factory.dump(UUID(int=1)), 1)
+        self.assertEqual(Factory().dump(UUID(int=1)), str(UUID(int=1)))
+
+    def test_common_schemas_dict(self):
+        registry = schema_helpers.CommonSchemas()
+        self.assertIsNotNone(registry.get(UUID))
+        self.assertIn(Decimal, registry)
+        self.assertNotIn(int, registry)
+        self.assertIsNone(registry.get(int))
+        self.assertIn(UUID, list(registry))
+        self.assertEqual(len(registry), len(registry.copy()))
+
+        del registry[UUID]
+        self.assertNotIn(UUID, registry)
+        self.assertIsNone(registry.get(UUID))
+        schema = Schema()
+        registry[UUID] = schema
+        self.assertIs(registry.get(UUID), schema)
+
+        saved = registry.copy()
+        registry.clear()
+        self.assertEqual(dict(registry), {})
+        self.assertNotIn(Decimal, registry)
+        registry.update(saved)
+        self.assertIs(registry[UUID], schema)
+        self.assertIn(Decimal, registry)
@@ -0,0 +1,60 @@
+import sys
+from dataclasses import dataclass
+from typing import Dict, Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+
+
+def new_str(value: str) -> str:
+    return "".join(list(value))
+
+
+@dataclass
+class Payment:
+    currency: str
+    status: Optional[str]
+    comment: str
+    amount: int
+
+
+class TestInternStrings(TestCase):
+    def setUp(self):
+        self.data = {
+            "currency": new_str("USD"),
+            "status": new_str("paid"),
+            "comment": new_str("some comment"),
+            "amount": 1,
+        }
+
+    def assert_interned(self, value: str):
+        self.assertIs(value, sys.intern(value))
+
+    def test_type(self):
+        factory = Factory(schemas={Payment: Schema(intern_strings=True)})
+        payment = factory.load(self.data, Payment)
+        self.assertEqual(payment, Payment("USD", "paid", "some comment", 1))
+        self.assert_interned(payment.currency)
+        self.assert_interned(payment.status)
+        self.assert_interned(payment.comment)
+
+    def test_fields(self):
+        factory = Factory(schemas={Payment: Schema(intern_strings=["currency"])})
+        payment = factory.load(self.data, Payment)
+        self.assert_interned(payment.currency)
+        self.assertIsNot(payment.comment, sys.intern(new_str("some comment")))
+
+    def test_str(self):
+        factory = Factory(schemas={str: Schema(intern_strings=True)})
+        payment = factory.load(self.data, Payment)
+        self.assert_interned(payment.currency)
+        self.assert_interned(payment.comment)
+        with self.assertRaises(ValueError):
+            factory.load(1, str)
+
+    def test_dict_keys(self):
+        factory = Factory(schemas={Dict[str, int]: Schema(intern_strings=True)})
+        res = factory.load({new_str("region"): 1}, Dict[str, int])
+        self.assertEqual(res, {"region": 1})
+        for key in res:
+            self.assert_interned(key)
@@ -0,0 +1,53 @@
+import gc
+from dataclasses import dataclass, field
+from typing import Generic, List, TypeVar
+from unittest import TestCase
+from unittest.mock import patch
+
+from dataclass_factory import Factory, Schema, NameStyle
+from dataclass_factory import fields as fields_module
+
+T = TypeVar("T")
+
+
+@dataclass
+class Tenant:
+    name_value: str
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Box(Generic[T]):
+    value: T
+
+
+class TestIntrospectionCache(TestCase):
+    def test_shared(self):
+        factory = Factory()
+        factory.load({"name_value": "x"}, Tenant)
+        with patch.object(fields_module, "resolve_hints", side_effect=AssertionError):
+            other = Factory(default_schema=Schema(name_style=NameStyle.camel_lower))
+            self.assertEqual(other.load({"nameValue": "x"}, Tenant), Tenant("x"))
+
+    def test_default_factory(self):
+        first = fields_module.all_dataclass_fields(Tenant)
+        second = fields_module.all_dataclass_fields(Tenant)
+        self.assertEqual(first, second)
+        self.assertIsNot(first[1].default, second[1].default)
+
+    def test_generic(self):
+        self.assertEqual(fields_module.all_dataclass_fields(Box[int])[0].type, int)
+        self.assertEqual(fields_module.all_dataclass_fields(Box[str])[0].type, str)
+
+    def test_weak(self):
+        @dataclass
+        class Temporary:
+            x: int
+
+        Factory().load({"x": 1}, Temporary)
+        self.assertIn(Temporary, fields_module._introspection_cache)
+        gc.collect()  # other unused classes must not be removed during the check
+        size = len(fields_module._introspection_cache)
+        del Temporary
+        gc.collect()
+        self.assertEqual(len(fields_module._introspection_cache), size - 1)
@@ -1,8 +1,11 @@
+import pickle
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import List, Union
 from unittest import TestCase
 
 from dataclass_factory import Factory, InvalidFieldError
+from dataclass_factory.exceptions import UnionParseError
 
 
 @dataclass
@@ -38,3 +41,64 @@ class TestInvalidData(TestCase):
             self.assertTrue(False, "ValueError exception expected")
         except InvalidFieldError as exc:
             self.assertEqual(['a', 'd'], exc.field_path)
+
+
+class TestReparseOnError(TestCase):
+    def setUp(self):
+        self.factory = Factory(debug_path=True, reparse_on_error=True)
+
+    def test_valid(self):
+        self.assertEqual(self.factory.load({"d": {"a": 1}, "e": 1}, Bar), Bar(Foo(1), MyEnum.one))
+        self.assertNotIn(Bar, self.factory._parsers)  # debug parser is not created
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidFieldError) as e:
+            self.factory.load({"d": {"a": "20x"}, "e": 1}, Bar)
+        self.assertEqual(["a", "d"], e.exception.field_path)
+        with self.assertRaises(InvalidFieldError) as e:
+            self.factory.load([{"a": 1}, {"a": "x"}], List[Foo])
+        self.assertEqual(["a", "1"], e.exception.field_path)
+
+    def test_include(self):
+        with self.assertRaises(InvalidFieldError) as e:
+            self.factory.parser(Bar, include=["d.a"])({"d": {"a": "x"}, "e": "wrong"})
+        self.assertEqual(["a", "d"], e.exception.field_path)
+
+
+@dataclass
+class Item:
+    x: List[int]
+
+
+class TestLazyMessages(TestCase):
+    def test_union_message(self):
+        data = {"key%s" % i: "x" * 1000 for i in range(100)}
+        with self.assertRaises(UnionParseError) as e:
+            Factory().parser(Union[int, List[int]])(data)
+        self.assertIs(e.exception._data, data)
+        self.assertIn("No suitable parsers in union found for `{", e.exception.message)
+        self.assertLess(len(e.exception.message), 300)
+        self.assertIn("Suberrors", str(e.exception))
+
+    def test_union_pickle(self):
+        with self.assertRaises(UnionParseError) as e:
+            Factory().parser(Union[int, List[int]])("x")
+        self.assertEqual(e.exception.message, "No suitable parsers in union found for `x`")
+        error = pickle.loads(pickle.dumps(e.exception))
+        self.assertEqual(error.message, e.exception.message)
+
+    def test_message(self):
+        with self.assertRaises(InvalidFieldError) as e:
+            Factory(debug_path=True).parser(Foo)({"a": "20x"})
+        self.assertIsInstance(e.exception._message, ValueError)
+        self.assertEqual(e.exception.message, "invalid literal for int() with base 10: '20x'")
+        e.exception.message = "wrong"
+        self.assertEqual(pickle.loads(pickle.dumps(e.exception)).message, "wrong")
+
+    def test_path(self):
+        with self.assertRaises(InvalidFieldError) as e:
+            Factory(debug_path=True).parser(List[Item])([{"x": [1]}, {"x": [1, "a"]}])
+        self.assertEqual(e.exception.field_path, ["1", "x", "1"])
+        self.assertIn("[1, x, 1]", str(e.exception))
+        e.exception.field_path.append("items")
+        self.assertIn("[1, x, 1, items]", str(e.exception))
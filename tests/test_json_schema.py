@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import List
+from unittest import TestCase
+
+from typing_extensions import TypedDict
+
+from dataclass_factory import Factory
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+@dataclass
+class Polygon:
+    name: str
+    points: List[Point]
+    tags: List[str]
+
+
+class TestJsonSchema(TestCase):
+    def test_collection(self):
+        self.assertEqual(Factory().json_schema(List[int]), {"type": "array", "items": {"type": "integer"}})
+
+    def test_collection_field(self):
+        factory = Factory()
+        schema = factory.json_schema(Polygon)
+        self.assertEqual(schema["properties"]["tags"], {"type": "array", "items": {"type": "string"}})
+        self.assertEqual(schema["properties"]["points"]["items"], {"$ref": "#/definitions/Point"})
+        self.assertEqual(
+            factory.json_schema_definitions()["Point"]["properties"],
+            {"x": {"type": "integer"}, "y": {"type": "integer"}},
+        )
@@ -0,0 +1,97 @@
+import pickle
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema, Unknown
+
+
+@dataclass
+class Line:
+    sku: str
+    count: int
+
+
+@dataclass
+class Order:
+    id: int
+    lines: List[Line]
+    customer: Optional[Dict[str, str]] = None
+    tags: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Scaled:
+    id: int
+    lines: List[Line]
+
+    def __init__(self, id: int, lines: List[Line]):
+        self.id = id * 10
+        self.lines = lines
+
+
+class TestLazy(TestCase):
+    def setUp(self):
+        self.factory = Factory(schemas={Order: Schema(lazy=True, bypass_init=True)})
+        self.data = {
+            "id": 1,
+            "lines": [{"sku": "a", "count": 1}, {"sku": "b", "count": "x"}],
+            "customer": {"name": "John"},
+        }
+
+    def test_lazy_access(self):
+        order = self.factory.load(self.data, Order)
+        self.assertIsInstance(order, Order)
+        self.assertEqual(order.id, 1)
+        self.assertNotIn("lines", vars(order))
+        self.assertEqual(order.customer, {"name": "John"})
+        self.assertIn("customer", vars(order))
+        self.assertEqual(order.tags, [])
+        with self.assertRaises(ValueError):
+            order.lines
+
+    def test_cached(self):
+        self.data["lines"][1]["count"] = 2
+        order = self.factory.load(self.data, Order)
+        self.assertIs(order.lines, order.lines)
+
+    def test_parsed_concurrently(self):
+        self.data["lines"][1]["count"] = 2
+        order = self.factory.load(self.data, Order)
+        descriptor = vars(type(order))["lines"]
+        lines = descriptor.__get__(order, type(order))
+        # another thread entered the descriptor before the value was stored
+        self.assertIs(descriptor.__get__(order, type(order)), lines)
+
+    def test_scalars_eager(self):
+        self.data["id"] = "x"
+        with self.assertRaises(ValueError):
+            self.factory.load(self.data, Order)
+
+    def test_eq(self):
+        self.data["lines"][1]["count"] = 2
+        expected = Order(1, [Line("a", 1), Line("b", 2)], {"name": "John"})
+        self.assertEqual(self.factory.load(self.data, Order), expected)
+        self.assertEqual(expected, self.factory.load(self.data, Order))
+
+    def test_dump(self):
+        self.data["lines"][1]["count"] = 2
+        order = self.factory.load(self.data, Order)
+        self.assertEqual(self.factory.dump(order), dict(self.data, tags=[]))
+
+    def test_pickle(self):
+        self.data["lines"][1]["count"] = 2
+        order = pickle.loads(pickle.dumps(self.factory.load(self.data, Order)))
+        self.assertIs(type(order), Order)
+        self.assertEqual(order.lines, [Line("a", 1), Line("b", 2)])
+
+    def test_custom_init(self):
+        factory = Factory(schemas={Scaled: Schema(lazy=True)})
+        with self.assertRaises(ValueError):
+            factory.parser(Scaled)
+        self.assertEqual(Factory().load({"id": 1, "lines": []}, Scaled).id, 10)
+
+    def test_store_unknown(self):
+        factory = Factory(schemas={Order: Schema(lazy=True, bypass_init=True, unknown=Unknown.STORE)})
+        with self.assertRaises(ValueError):
+            factory.parser(Order)
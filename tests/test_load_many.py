@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory, InvalidFieldError, LoadManyResult, Schema, validate, validate_batch
+
+
+@dataclass
+class Line:
+    sku: str
+    count: int
+
+
+@dataclass
+class Row:
+    id: int
+    name: str
+    lines: List[Line]
+    comment: Optional[str] = None
+
+
+class RowSchema(Schema):
+    @validate("id")
+    def positive(self, data):
+        if data <= 0:
+            raise ValueError("id must be positive")
+        return data
+
+    @validate_batch("id")
+    def unique(self, ids):
+        if len(set(ids)) != len(ids):
+            raise ValueError("Duplicate ids")
+
+    @validate_batch("name")
+    def names(self, names):
+        if len(names) > 3:
+            raise ValueError("Too many names")
+
+
+class TestLoadMany(TestCase):
+    def setUp(self):
+        self.factory = Factory(schemas={Row: RowSchema(name_mapping={"name": ("info", "name")})})
+        self.rows = [
+            {"id": 1, "info": {"name": "a"}, "lines": []},
+            {"id": "x", "info": {"name": "b"}, "lines": [{"sku": "s", "count": 1}, {"sku": "t", "count": "y"}]},
+            {"id": 3, "info": {"name": "c"}, "lines": [{"sku": "s", "count": 2}]},
+            {"id": -1, "lines": []},
+            "invalid",
+        ]
+
+    def test_collect(self):
+        result = self.factory.load_many(self.rows, Row, errors="collect")
+        self.assertEqual(result.items, [Row(1, "a", []), Row(3, "c", [Line("s", 2)])])
+        self.assertEqual(set(result.errors), {1, 3, 4})
+        self.assertEqual(set(result.errors[1]), {("id",), ("lines", "1", "count")})
+        self.assertEqual(result.errors[3], {("id",): "id must be positive", ("info", "name"): "Field is required"})
+        self.assertEqual(list(result.errors[4]), [()])
+
+    def test_raise(self):
+        with self.assertRaises(InvalidFieldError) as e:
+            self.factory.load_many(self.rows, Row)
+        self.assertEqual(e.exception.field_path, ["id", "1"])
+
+    def test_debug_path_factory(self):
+        factory = Factory(schemas={Row: RowSchema(name_mapping={"name": ("info", "name")})}, debug_path=True)
+        result = factory.load_many(self.rows, Row, errors="collect")
+        self.assertEqual(set(result.errors), {1, 3, 4})
+        with self.assertRaises(InvalidFieldError):
+            factory.load_many(self.rows, Row)
+        self.assertEqual(factory._variants, {})
+
+    def test_valid(self):
+        result = self.factory.load_many(self.rows[:1], Row)
+        self.assertEqual(result, LoadManyResult([Row(1, "a", [])], {}))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            self.factory.load_many([], Row, errors="ignore")
+
+    def test_batch_validators(self):
+        rows = [self.rows[0], self.rows[2], dict(self.rows[0], lines=[{"sku": "s", "count": "y"}]), self.rows[0]]
+        result = self.factory.load_many(rows, Row, errors="collect")
+        self.assertEqual(len(result.items), 3)
+        self.assertEqual(set(result.errors), {2})
+        self.assertEqual(result.batch_errors, {("id",): "Duplicate ids"})
+        with self.assertRaises(ValueError):
+            self.factory.load_many(rows[:2] + rows[3:], Row)
+        rows = [dict(self.rows[0], id=i) for i in range(1, 5)]
+        result = self.factory.load_many(rows, Row, errors="collect")
+        self.assertEqual(result.batch_errors, {("info", "name"): "Too many names"})
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from unittest import TestCase
 
@@ -184,3 +185,12 @@ class TestSerializer(TestCase):
 
         serializer = Factory().serializer(Data)
         self.assertEqual(serializer(d), data)
+
+    def test_interned_keys(self):
+        # flattened dicts are copied from a prepared structure, their keys must not be copied as well
+        factory = Factory(default_schema=Schema(name_style=NameStyle.camel, name_mapping={"NameToMap": ("map", "x")}))
+        first, second = factory.dump([Data(1, 2, 3), Data(4, 5, 6)])
+        self.assertEqual(first, {"StyledName": 1, "TrailedName": 2, "map": {"x": 3}})
+        for key, other_key in zip([*first, *first["map"]], [*second, *second["map"]]):
+            self.assertIs(key, other_key)
+            self.assertIs(key, sys.intern(key))
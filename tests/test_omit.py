@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import List, Any
+from enum import Enum
+from typing import Any, Dict, List, Optional
 from unittest import TestCase
 
 from dataclass_factory import Factory, Schema
@@ -17,6 +18,42 @@ class DataUnderscore:
     from_: int = 1
 
 
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Point:
+    def __init__(self, x: int):
+        self.x = x
+
+
+@dataclass
+class Shape:
+    color: Color = Color.RED
+    points: List[Point] = field(default_factory=list)
+    name: Optional[str] = None
+    tags: Dict[str, str] = field(default_factory=dict)
+    size: int = 0
+
+
+class Vector:
+    def __init__(self, *items: int):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __bool__(self):
+        raise ValueError("The truth value of a vector is ambiguous")
+
+
+@dataclass
+class Measure:
+    name: str
+    vector: Vector
+
+
 schema = Schema[Any](omit_default=True, trim_trailing_underscore=True)
 
 
@@ -30,3 +67,42 @@ class TestDefault(TestCase):
         self.assertEqual(factory.dump(Data()), {})
         self.assertEqual(factory.dump(Data(1, [], "test")), {})
         self.assertEqual(factory.dump(Data(2, [], "test")), {"x": 2})
+
+    def test_raw_default(self):
+        factory = Factory(default_schema=schema)
+        self.assertEqual(factory.dump(Shape()), {})
+        self.assertEqual(factory.dump(Shape(Color.GREEN, size=1)), {"color": "green", "size": 1})
+
+    def test_not_serialized(self):
+        def fail(data):
+            raise AssertionError("Omitted field is serialized")
+
+        factory = Factory(default_schema=schema, schemas={Point: Schema(serializer=fail)})
+        self.assertEqual(factory.dump(Shape(name="a")), {"name": "a"})
+
+
+class TestOmitNoneEmpty(TestCase):
+    def test_none(self):
+        factory = Factory(default_schema=Schema(omit_none=True))
+        self.assertEqual(factory.dump(Shape()), {"color": "red", "points": [], "tags": {}, "size": 0})
+
+    def test_empty(self):
+        factory = Factory(default_schema=Schema(omit_empty=True))
+        self.assertEqual(
+            factory.dump(Shape(tags={"a": "b"})),
+            {"color": "red", "name": None, "tags": {"a": "b"}, "size": 0},
+        )
+        self.assertEqual(factory.dump(Shape(name="")), {"color": "red", "size": 0})
+
+    def test_empty_ambiguous_truth(self):
+        factory = Factory(
+            default_schema=Schema(omit_empty=True),
+            schemas={Vector: Schema(serializer=lambda v: list(v.items))},
+        )
+        self.assertEqual(factory.dump(Measure("a", Vector())), {"name": "a"})
+        self.assertEqual(factory.dump(Measure("a", Vector(1))), {"name": "a", "vector": [1]})
+
+    def test_flattening(self):
+        factory = Factory(default_schema=Schema(omit_none=True, name_mapping={"name": ("a", "b")}))
+        with self.assertRaises(ValueError):
+            factory.serializer(Shape)
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema, SKIPPED, validate_batch
+
+
+@dataclass
+class Customer:
+    name: str
+    email: str
+
+
+@dataclass
+class Line:
+    sku: str
+    count: int
+
+
+@dataclass
+class Order:
+    id: int
+    customer: Customer
+    lines: List[Line]
+    comment: Optional[str] = None
+    meta: Optional[Dict[str, Customer]] = None
+
+
+DATA = {
+    "id": 1,
+    "customer": {"name": "John", "email": "invalid"},
+    "lines": [{"sku": "a", "count": "invalid"}],
+    "comment": "hello",
+    "meta": {"x": {"name": "Jane", "email": 1}},
+}
+
+
+class LineSchema(Schema):
+    @validate_batch("sku")
+    def unique(self, skus):
+        if len(set(skus)) != len(skus):
+            raise ValueError("Duplicate sku")
+
+
+class TestProjection(TestCase):
+    def setUp(self):
+        self.factory = Factory()
+
+    def test_projection(self):
+        parser = self.factory.parser(Order, include={"id", "customer.name", "lines[].sku", "meta.name"})
+        order = parser(DATA)
+        self.assertEqual(order.id, 1)
+        self.assertEqual(order.customer.name, "John")
+        self.assertIs(order.customer.email, SKIPPED)
+        self.assertEqual(order.lines[0].sku, "a")
+        self.assertIs(order.lines[0].count, SKIPPED)
+        self.assertIsNone(order.comment)
+        self.assertEqual(order.meta["x"].name, "Jane")
+
+    def test_whole_field(self):
+        parser = self.factory.parser(Order, include={"customer", "customer.name"})
+        order = parser(DATA)
+        self.assertEqual(order.customer, Customer("John", "invalid"))
+        self.assertIs(order.id, SKIPPED)
+        self.assertIs(order.lines, SKIPPED)
+
+    def test_cache(self):
+        first = self.factory.parser(Order, include=["id"])
+        self.assertIs(first, self.factory.parser(Order, include={"id"}))
+        self.assertIsNot(first, self.factory.parser(Order, include={"comment"}))
+
+    def test_list(self):
+        parser = self.factory.parser(List[Line], include={"sku"})
+        self.assertEqual(parser([{"sku": "x", "count": "y"}]), [Line("x", SKIPPED)])
+
+    def test_batch_validators(self):
+        factory = Factory(schemas={Line: LineSchema()})
+        data = [{"sku": "x", "count": 1}, {"sku": "x", "count": 2}]
+        for class_ in (List[Line], Tuple[Line, ...]):
+            with self.subTest(class_=class_):
+                with self.assertRaises(ValueError):
+                    factory.parser(class_, include={"sku"})(data)
+                # skipped fields are not validated
+                self.assertEqual(len(factory.parser(class_, include={"count"})(data)), 2)
+        with self.assertRaises(ValueError):
+            factory.parser(Order, include={"lines.sku"})({"lines": data})
+
+    def test_bypass_init(self):
+        factory = Factory(default_schema=Schema(bypass_init=True))
+        self.assertEqual(factory.parser(Line, include={"sku"})({"sku": "x"}), Line("x", SKIPPED))
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.factory.parser(Order, include={"customer.phone"})
+        with self.assertRaises(ValueError):
+            self.factory.parser(Order, include={"comment.text"})
@@ -1,7 +1,9 @@
+import pickle
 from dataclasses import dataclass
 from unittest import TestCase
 
-from dataclass_factory import Factory, Schema
+from dataclass_factory import Factory, NameStyle, Schema
+from dataclass_factory.schema import merge_schema, ResolvedSchema
 
 
 @dataclass
@@ -12,6 +14,11 @@ class Data:
     _d: str = ""
 
 
+class CustomSchema(Schema):
+    def custom(self):
+        return "custom"
+
+
 class TestFactory(TestCase):
     def test_only_mapping(self):
         factory = Factory(
@@ -91,3 +98,31 @@ class TestFactory(TestCase):
         serial = {"a": "XXX", "_d": "DD"}
         data2 = Data(a="XXX", _d="DD")
         self.assertEqual(factory.load(serial, Data), data2)
+
+    def test_merge_flat(self):
+        first = Schema(only=("a",))
+        second = Schema(only=("b",), skip_internal=True)
+        merged = merge_schema(merge_schema(first, second), second, Schema(name_style=NameStyle.upper))
+        self.assertEqual(len(merged._schemas), 3)
+        self.assertEqual(merged.only, ("a",))
+        self.assertTrue(merged.skip_internal)
+        self.assertEqual(merged.name_style, NameStyle.upper)
+
+    def test_resolved(self):
+        factory = Factory(
+            default_schema=Schema(name_style=NameStyle.upper, only_mapped=False),
+            schemas={Data: CustomSchema(only=("a",))},
+        )
+        schema = factory.schema(Data)
+        self.assertIsInstance(schema, ResolvedSchema)
+        self.assertIs(factory.schema(Data), schema)
+        self.assertEqual(schema.only, ("a",))
+        self.assertEqual(schema.name_style, NameStyle.upper)
+        self.assertTrue(schema.skip_internal)
+        self.assertIsNone(schema.exclude)
+        self.assertEqual(schema.custom(), "custom")
+        with self.assertRaises(AttributeError):
+            schema.only = ("b",)
+        with self.assertRaises(AttributeError):
+            schema.unknown_attribute  # noqa B018
+        self.assertEqual(pickle.loads(pickle.dumps(schema)).only, ("a",))
@@ -0,0 +1,62 @@
+from dataclasses import dataclass, field, make_dataclass
+from typing import Any, Dict, List, Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from dataclass_factory import Factory, InvalidFieldError, Schema, Unknown, UnknownFieldsError
+from dataclass_factory import parsers
+
+Wide = make_dataclass("Wide", [
+    ("required", int),
+    *((f"field_{i}", Optional[int], field(default=None)) for i in range(40)),
+    ("nested", Optional[Dict[str, Any]], field(default=None)),
+])
+
+
+@dataclass
+class Row:
+    items: List[Wide]
+
+
+SPARSE_DATA = [
+    {"required": 1},
+    {"required": 1, "field_3": 3, "field_39": "39"},
+    {"field_3": 3, "required": 2, "nested": {"x": 1}},
+]
+
+
+class TestSparse(TestCase):
+    def all_fields_factory(self, **kwargs) -> Factory:
+        factory = Factory(**kwargs)
+        with patch.object(parsers, "SPARSE_MIN_FIELDS", 10 ** 6):
+            factory.parser(Wide)
+        return factory
+
+    def test_same_result(self):
+        for schema in (Schema(), Schema(bypass_init=True), Schema(name_mapping={"field_3": ("nested", "x")})):
+            sparse_factory = Factory(schemas={Wide: schema})
+            all_fields_factory = self.all_fields_factory(schemas={Wide: schema})
+            for data in SPARSE_DATA:
+                with self.subTest(data=data, schema=schema):
+                    self.assertEqual(sparse_factory.load(data, Wide), all_fields_factory.load(data, Wide))
+
+    def test_dense(self):
+        data = {"required": 1, **{f"field_{i}": i for i in range(40)}}
+        self.assertEqual(Factory().load(data, Wide), self.all_fields_factory().load(data, Wide))
+
+    def test_missing(self):
+        with self.assertRaises(TypeError):
+            Factory().load({"field_1": 1}, Wide)
+
+    def test_unknown(self):
+        factory = Factory(schemas={Wide: Schema(unknown=Unknown.FORBID)})
+        with self.assertRaises(UnknownFieldsError):
+            factory.load({"required": 1, "other": 1}, Wide)
+        factory = Factory(schemas={Wide: Schema(unknown="nested")})
+        self.assertEqual(factory.load({"required": 1, "other": 1}, Wide).nested, {"other": 1})
+
+    def test_debug_path(self):
+        factory = Factory(debug_path=True)
+        with self.assertRaises(InvalidFieldError) as e:
+            factory.load({"items": [{"required": 1, "field_7": "x"}]}, Row)
+        self.assertEqual(e.exception.field_path, ["field_7", "0", "items"])
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import List, NewType, Optional, Union
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+
+
+@dataclass
+class Payment:
+    amount: float
+    count: int
+    confirmed: bool
+    fee: Optional[complex] = None
+
+
+Cents = NewType("Cents", int)
+
+
+@dataclass
+class Price:
+    amount: Cents
+
+
+@dataclass
+class Basket:
+    counts: List[int]
+    code: Union[int, str]
+    price: Optional[Price] = None
+
+
+class TestStrict(TestCase):
+    def setUp(self):
+        self.factory = Factory(default_schema=Schema(strict=True))
+
+    def test_exact(self):
+        data = {"amount": 1.5, "count": 2, "confirmed": False, "fee": 1j}
+        self.assertEqual(self.factory.load(data, Payment), Payment(1.5, 2, False, 1j))
+
+    def test_coercion(self):
+        res = self.factory.load({"amount": 1, "count": 2, "confirmed": True, "fee": 1.5}, Payment)
+        self.assertEqual(res, Payment(1.0, 2, True, 1.5 + 0j))
+        self.assertIs(type(res.amount), float)
+        self.assertIs(type(res.fee), complex)
+
+    def test_invalid(self):
+        for value, class_ in [
+            ("12", int), (3.9, int), (True, int),
+            ("false", bool), (1, bool),
+            ("1.5", float), (True, float),
+        ]:
+            with self.subTest(value=value, class_=class_):
+                with self.assertRaises(ValueError):
+                    self.factory.load(value, class_)
+
+    def test_per_type(self):
+        factory = Factory(schemas={int: Schema(strict=True)})
+        self.assertEqual(factory.load("1.5", float), 1.5)
+        with self.assertRaises(ValueError):
+            factory.load("1", int)
+
+    def test_per_class(self):
+        factory = Factory(schemas={Payment: Schema(strict=True)})
+        self.assertEqual(factory.load({"amount": 1, "count": 2, "confirmed": True}, Payment), Payment(1.0, 2, True))
+        for data in (
+            {"amount": "1.5", "count": 2, "confirmed": True},
+            {"amount": 1.5, "count": 2.9, "confirmed": True},
+            {"amount": 1.5, "count": 2, "confirmed": True, "fee": "1"},
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    factory.load(data, Payment)
+        self.assertEqual(factory.load("12", int), 12)
+
+    def test_per_class_nested(self):
+        factory = Factory(schemas={Basket: Schema(strict=True)})
+        self.assertEqual(
+            factory.load({"counts": [1], "code": "a", "price": {"amount": 2}}, Basket),
+            Basket([1], "a", Price(Cents(2))),
+        )
+        for data in (
+            {"counts": [2.9], "code": 1},
+            {"counts": [], "code": 2.9},
+            {"counts": [], "code": 1, "price": {"amount": "2"}},
+        ):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    factory.load(data, Basket)
+        self.assertEqual(factory.load(["1"], List[int]), [1])
+        self.assertEqual(factory.load({"amount": "2"}, Price), Price(Cents(2)))
+
+    def test_per_class_nested_not_strict(self):
+        factory = Factory(schemas={Basket: Schema(strict=True), Price: Schema(strict=False)})
+        data = {"counts": [1], "code": 1, "price": {"amount": "2"}}
+        self.assertEqual(factory.load(data, Basket), Basket([1], 1, Price(Cents(2))))
+
+    def test_per_class_own_parser(self):
+        factory = Factory(schemas={
+            Price: Schema(strict=True),
+            Cents: Schema(parser=lambda x: Cents(round(float(x) * 100))),
+        })
+        self.assertEqual(factory.load({"amount": "1.5"}, Price), Price(Cents(150)))
+
+    def test_per_class_projection(self):
+        factory = Factory(schemas={Basket: Schema(strict=True)})
+        with self.assertRaises(ValueError):
+            factory.parser(Basket, include={"counts"})({"counts": [2.9]})
+
+    def test_not_strict(self):
+        self.assertEqual(Factory().load("12", int), 12)
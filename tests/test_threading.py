@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+from unittest import TestCase
+
+from dataclass_factory import Factory
+
+
+@dataclass
+class Node:
+    value: int
+    children: List["Node"]
+    parent_name: Optional[str] = None
+
+
+class TestThreading(TestCase):
+    def test_shared_converters(self):
+        factory = Factory()
+        with ThreadPoolExecutor(8) as executor:
+            parsers = list(executor.map(lambda _: factory.parser(List[Node]), range(32)))
+            serializers = list(executor.map(lambda _: factory.serializer(List[Node]), range(32)))
+        self.assertTrue(all(p is parsers[0] for p in parsers))
+        self.assertTrue(all(s is serializers[0] for s in serializers))
+
+    def test_parallel_load(self):
+        factory = Factory()
+        data = [{"value": i, "children": [{"value": i + 1, "children": []}]} for i in range(100)]
+        expected = [Node(i, [Node(i + 1, [])]) for i in range(100)]
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: factory.load(data, List[Node]), range(16)))
+        for result in results:
+            self.assertEqual(result, expected)
+
+    def test_schema_not_modified(self):
+        factory = Factory()
+        factory.parser(Node)
+        factory.serializer(Node)
+        self.assertIsNone(factory.schema(Node).parser)
+        self.assertIsNone(factory.schema(Node).serializer)
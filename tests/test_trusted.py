@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, NewType, Optional, Union
+from unittest import TestCase
+
+from typing_extensions import Literal, TypedDict
+
+from dataclass_factory import Factory, Schema
+
+
+class Color(Enum):
+    red = "red"
+
+
+@dataclass
+class Line:
+    sku: str
+    count: int
+
+
+@dataclass
+class Order:
+    id: int
+    color: Color
+    created: datetime
+    lines: List[Line]
+    tags: Dict[str, int]
+    comment: Optional[str] = None
+
+
+class Point(TypedDict):
+    x: int
+    y: int
+
+
+class TestTrusted(TestCase):
+    def setUp(self):
+        self.schemas = {datetime: Schema(parser=datetime.fromisoformat)}
+        self.data = {
+            "id": 1,
+            "color": "red",
+            "created": "2020-01-01T00:00:00",
+            "lines": [{"sku": "a", "count": 2}],
+            "tags": {"x": 1},
+        }
+        self.expected = Order(
+            id=1,
+            color=Color.red,
+            created=datetime(2020, 1, 1),
+            lines=[Line("a", 2)],
+            tags={"x": 1},
+        )
+
+    def test_structures(self):
+        factory = Factory(schemas=self.schemas, trusted=True)
+        self.assertEqual(factory.load(self.data, Order), self.expected)
+
+    def test_no_checks(self):
+        factory = Factory(trusted=True)
+        self.assertEqual(factory.load(1, str), 1)
+        self.assertEqual(factory.load("1", int), "1")
+        self.assertEqual(factory.load({"x": 1}, Point), {"x": 1})
+
+    def test_union(self):
+        factory = Factory(trusted=True)
+        self.assertEqual(factory.load({"sku": "a", "count": 1}, Union[int, Line]), Line("a", 1))
+        self.assertEqual(factory.load(1, Union[Line, int]), 1)
+        self.assertEqual(factory.load("x", Optional[Union[int, str]]), "x")
+        self.assertIsNone(factory.load(None, Optional[Union[int, str]]))
+
+    def test_union_unchecked_members(self):
+        factory = Factory(trusted=True)
+        data = {"sku": "a", "count": 1}
+        self.assertEqual(factory.load(data, Union[Literal["a"], Line]), Line("a", 1))
+        self.assertEqual(factory.load("a", Union[Literal["a"], Line]), "a")
+        self.assertEqual(factory.load(data, Union[NewType("Sku", str), Line]), Line("a", 1))
+        self.assertEqual(factory.load("a", Union[NewType("Sku", str), Line]), "a")
+        self.assertEqual(factory.load(data, Union[List[int], Line]), Line("a", 1))
+        self.assertEqual(factory.load([1], Union[List[int], Line]), [1])
+
+    def test_per_call(self):
+        factory = Factory(schemas=self.schemas)
+        self.assertEqual(factory.load(self.data, Order, trusted=True), self.expected)
+        self.assertEqual(factory.load("1", int, trusted=True), "1")
+        self.assertEqual(factory.load("1", int), 1)
+        self.assertIs(factory.parser(Order, trusted=True), factory.parser(Order, trusted=True))
+        self.assertIsNot(factory.parser(Order, trusted=True), factory.parser(Order))
+        with self.assertRaises(ValueError):
+            factory.load(1, str)
@@ -103,3 +103,31 @@ class TestFactory(TestCase):
         data = factory.load(serialized, DataWithExtras)
         self.assertEqual(data.a, "AA")
         self.assertEqual(data.extras, {"b": "b"})
+
+    def test_store_separate_not_modified(self):
+        factory = Factory(
+            default_schema=Schema(
+                unknown=["unknown", "sub"],
+            ),
+        )
+        serialized = {"a": "AA", "b": "b", "unknown": {"x": 1}}
+        data = factory.load(serialized, Data)
+        self.assertEqual(data, Data("AA", {"b": "b"}, Sub("b")))
+        self.assertEqual(serialized, {"a": "AA", "b": "b", "unknown": {"x": 1}})
+
+    def test_flattened(self):
+        serialized = {"a": "AA", "nested": {"b": {"x": 1}}}
+        factory = Factory(
+            default_schema=Schema(
+                unknown=Unknown.FORBID,
+                name_mapping={"unknown": ("nested", "b")},
+            ),
+        )
+        self.assertEqual(factory.load(serialized, Data), Data("AA", {"x": 1}))
+        factory = Factory(
+            default_schema=Schema(
+                unknown="sub",
+                name_mapping={"unknown": ("nested", "b")},
+            ),
+        )
+        self.assertEqual(factory.load({**serialized, "b": "c"}, Data), Data("AA", {"x": 1}, Sub("c")))
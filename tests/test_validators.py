@@ -1,7 +1,10 @@
 from dataclasses import dataclass
+from typing import List
 from unittest import TestCase
 
-from dataclass_factory import Factory, NameStyle, Schema, validate
+from typing_extensions import TypedDict
+
+from dataclass_factory import Factory, NameStyle, Schema, validate, validate_batch
 
 
 class MySchema(Schema):
@@ -85,3 +88,83 @@ class ValidationTestCase(TestCase):
             factory.load({"field_name": 100000, "other_field": 666}, My)
         with self.assertRaises(ValueError):
             factory.load({"field_name": -10000, "other_field": 666}, My)
+
+    def test_bound_per_instance(self):
+        first, second = MySchema(), MySchema()
+        self.assertIs(first.pre_validators[None][0].__self__, first)
+        self.assertIs(second.pre_validators[None][0].__self__, second)
+        self.assertEqual(len(first.post_validators["field_name"]), 1)
+
+    def test_inherited(self):
+        class ChildSchema(My2decSchema):
+            @validate("other_field", pre=True)
+            def v2(self, data):
+                return data * 2
+
+        factory = Factory(schemas={My: ChildSchema()})
+        res = factory.load({"field_name": 100, "other_field": 10}, My)
+        self.assertEqual(res, My(101, 21))
+
+
+class BatchSchema(Schema):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    @validate_batch("field_name")
+    def unique(self, values):
+        self.calls.append(values)
+        if len(set(values)) != len(values):
+            raise ValueError("Duplicate values")
+
+
+class TotalSchema(Schema):
+    @validate_batch()
+    def total(self, items):
+        if sum(x.other_field for x in items) > 100:
+            raise ValueError("Sum is too big")
+        return items
+
+
+class MyDict(TypedDict, total=False):
+    field_name: int
+
+
+class BatchValidationTestCase(TestCase):
+    def test_field(self):
+        schema = BatchSchema()
+        factory = Factory(schemas={My: schema})
+        res = factory.load([{"field_name": 1, "other_field": 1}, {"field_name": 2, "other_field": 2}], List[My])
+        self.assertEqual(res, [My(1, 1), My(2, 2)])
+        self.assertEqual(schema.calls, [[1, 2]])
+        with self.assertRaises(ValueError):
+            factory.load([{"field_name": 1, "other_field": 1}, {"field_name": 1, "other_field": 2}], List[My])
+
+    def test_items(self):
+        factory = Factory(schemas={My: TotalSchema()})
+        factory.load([{"field_name": 1, "other_field": 60}], List[My])
+        with self.assertRaises(ValueError):
+            factory.load([{"field_name": 1, "other_field": 60}, {"field_name": 2, "other_field": 60}], List[My])
+
+    def test_single_item(self):
+        schema = BatchSchema()
+        factory = Factory(schemas={My: schema})
+        factory.load({"field_name": 1, "other_field": 1}, My)
+        self.assertEqual(schema.calls, [])
+
+    def test_typed_dict(self):
+        schema = BatchSchema()
+        factory = Factory(schemas={MyDict: schema})
+        with self.assertRaises(ValueError):
+            factory.load([{"field_name": 1}, {}, {"field_name": 1}], List[MyDict])
+        self.assertEqual(schema.calls, [[1, 1]])
+
+    def test_as_array(self):
+        class ArraySchema(Schema):
+            @validate_batch("field_name", as_array=True)
+            def check(self, values):
+                self.values = values
+
+        schema = ArraySchema()
+        Factory(schemas={My: schema}).load([{"field_name": 1, "other_field": 1}], List[My])
+        self.assertEqual(list(schema.values), [1])
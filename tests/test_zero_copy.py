@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import TestCase
+
+from dataclass_factory import Factory, Schema
+
+
+@dataclass
+class Series:
+    points: List[float]
+    labels: Dict[str, int]
+    pair: Tuple[int, str]
+    optional: List[Optional[int]]
+
+
+class TestSerializerCopy(TestCase):
+    def setUp(self):
+        self.series = Series([1.5, 2], {"a": 1}, (1, "x"), [1, None])
+        self.expected = {"points": [1.5, 2], "labels": {"a": 1}, "pair": [1, "x"], "optional": [1, None]}
+
+    def test_copy(self):
+        factory = Factory()
+        res = factory.dump(self.series)
+        self.assertEqual(res, self.expected)
+        self.assertIsNot(res["points"], self.series.points)
+        self.assertIsNot(res["labels"], self.series.labels)
+        self.assertEqual(factory.dump((1, 2), Tuple[int, ...]), [1, 2])
+
+    def test_zero_copy(self):
+        factory = Factory(default_schema=Schema(zero_copy=True))
+        res = factory.dump(self.series)
+        self.assertEqual(res, self.expected)
+        self.assertIs(res["points"], self.series.points)
+        self.assertIs(res["labels"], self.series.labels)
+        self.assertIs(res["optional"], self.series.optional)
+        self.assertEqual(res["pair"], [1, "x"])
+
+    def test_not_plain(self):
+        factory = Factory(default_schema=Schema(zero_copy=True))
+        self.assertEqual(factory.dump([self.series], List[Series]), [self.expected])
+        self.assertEqual(factory.dump([self.series], List[Any]), [self.expected])
+
+
+@dataclass
+class Vendor:
+    extra: Dict[str, Any]
+    items: List[Any]
+    ids: List[Optional[Any]]
+
+
+class TestParserCopy(TestCase):
+    def setUp(self):
+        self.data = {"extra": {"a": {"b": [1, 2]}}, "items": [{"c": 1}], "ids": [1, None]}
+
+    def test_copy(self):
+        factory = Factory()
+        res = factory.load(self.data, Vendor)
+        self.assertEqual(res, Vendor(self.data["extra"], self.data["items"], [1, None]))
+        self.assertIsNot(res.extra, self.data["extra"])
+        self.assertIsNot(res.items, self.data["items"])
+        self.assertIs(res.extra["a"], self.data["extra"]["a"])
+        self.assertEqual(factory.load((1, 2), List[Any]), [1, 2])
+
+    def test_zero_copy(self):
+        factory = Factory(default_schema=Schema(zero_copy=True))
+        res = factory.load(self.data, Vendor)
+        self.assertIs(res.extra, self.data["extra"])
+        self.assertIs(res.items, self.data["items"])
+        self.assertIs(res.ids, self.data["ids"])
+        self.assertEqual(factory.load((1, 2), List[Any]), [1, 2])
+
+    def test_invalid(self):
+        factory = Factory()
+        with self.assertRaises(ValueError):
+            factory.load({1: 1}, Dict[str, Any])
+        with self.assertRaises(AttributeError):
+            factory.load([1], Dict[str, Any])